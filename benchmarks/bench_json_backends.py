@@ -0,0 +1,93 @@
+"""Benchmarks GeoJSON <> GeoParquet conversions with each installed JSON backend.
+
+Covers loading a GeoJSON file, encoding the 'properties' column, decoding geometries
+into pydantic models, and streaming a GeoJSON file.
+
+Usage:
+    python benchmarks/bench_json_backends.py --features 20000
+"""
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import timeit
+from pathlib import Path
+
+import pyarrow
+
+from geoparquet_pydantic import json_backend
+from geoparquet_pydantic.convert import (
+    geojson_to_geoparquet,
+    geoparquet_to_geojson,
+    geoparquet_to_geojson_file,
+)
+
+
+def make_geojson(features: int) -> dict:
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [[i, 0], [i + 1, 0], [i + 1, 1], [i, 1], [i, 0]],
+                    ],
+                },
+                "properties": {
+                    "name": f"feature_{i}",
+                    "value": i / 3,
+                    "tags": ["a", "b", "c"],
+                    "nested": {"id": i, "valid": True},
+                },
+            }
+            for i in range(features)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--features", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    backends = [
+        name
+        for name in json_backend.JSON_BACKENDS
+        if name == "json" or importlib.util.find_spec(name)
+    ]
+    print(f"{args.features} features, backends: {backends}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        geojson_path = Path(temp_dir) / "features.geojson"
+        geojson_path.write_text(json.dumps(make_geojson(args.features)))
+        output_path = Path(temp_dir) / "output.geojson"
+        table = geojson_to_geoparquet(
+            geojson_path,
+            column_schema=pyarrow.schema([("name", pyarrow.string())]),
+        )
+
+        for backend in backends:
+            json_backend.set_json_backend(backend)
+
+            def report(name: str, func) -> None:
+                best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+                print(f"{backend:<8} {name:<28} {best:8.3f}s")
+
+            report(
+                "load GeoJSON file",
+                lambda: json_backend.loads(geojson_path.read_bytes()),
+            )
+            report("geojson_to_geoparquet", lambda: geojson_to_geoparquet(geojson_path))
+            report("geoparquet_to_geojson", lambda: geoparquet_to_geojson(table))
+            report(
+                "geoparquet_to_geojson_file",
+                lambda: geoparquet_to_geojson_file(table, output_path),
+            )
+
+
+if __name__ == "__main__":
+    main()
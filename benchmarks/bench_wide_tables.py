@@ -0,0 +1,73 @@
+"""Benchmarks converting wide GeoParquet tables (100+ property columns) to GeoJSON.
+
+Compares the per-batch properties assembly of geoparquet_to_geojson() against the
+previous per-cell (name, value) tuple approach.
+
+Usage:
+    python benchmarks/bench_wide_tables.py --rows 10000 --columns 150
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+import pyarrow
+import shapely
+
+from geoparquet_pydantic.convert import (
+    _batch_to_records,
+    geoparquet_to_geojson,
+)
+
+
+def make_wide_table(rows: int, columns: int) -> pyarrow.Table:
+    points = shapely.points([(i, i) for i in range(rows)])
+    data: dict[str, Any] = {"geometry": shapely.to_wkb(points).tolist()}
+    for c in range(columns):
+        if c % 3 == 0:
+            data[f"col{c}"] = [f"value_{i}" for i in range(rows)]
+        elif c % 3 == 1:
+            data[f"col{c}"] = list(range(rows))
+        else:
+            data[f"col{c}"] = [i / 3 for i in range(rows)]
+    return pyarrow.Table.from_pydict(data)
+
+
+def tuple_records(chunk: pyarrow.RecordBatch, primary_column: str) -> list[dict]:
+    """The previous approach: (name, value) tuples per cell, reassembled per row."""
+    chunk_dict = chunk.to_pydict()
+    chunk_dict.pop(primary_column)
+    properties = [
+        list(zip([name] * len(values), values)) for name, values in chunk_dict.items()
+    ]
+    return [dict([p[i] for p in properties]) for i in range(chunk.num_rows)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    table = make_wide_table(args.rows, args.columns)
+    batches = table.to_batches(max_chunksize=1000)
+    print(f"{args.rows} rows x {args.columns} property columns")
+
+    def report(name: str, func) -> None:
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name:<28} {best:8.3f}s  ({best / args.rows * 1e6:.1f} us/row)")
+
+    report(
+        "tuple records (previous)",
+        lambda: [tuple_records(b, "geometry") for b in batches],
+    )
+    report(
+        "_batch_to_records",
+        lambda: [_batch_to_records(b, "geometry") for b in batches],
+    )
+    report("geoparquet_to_geojson", lambda: geoparquet_to_geojson(table))
+
+
+if __name__ == "__main__":
+    main()
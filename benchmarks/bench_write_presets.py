@@ -0,0 +1,106 @@
+"""Benchmarks the write_geoparquet() presets: write time, file size, and read times.
+
+The spatial read selects ~1% of the features with a bbox filter, using the 'bbox'
+covering column statistics if the file has one, otherwise decoding every geometry.
+
+Usage:
+    python benchmarks/bench_write_presets.py --features 200000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow
+import pyarrow.dataset
+import pyarrow.parquet
+import shapely
+
+from geoparquet_pydantic.convert import _encode_metadata
+from geoparquet_pydantic.write import WRITE_PRESETS, write_geoparquet
+
+
+def make_table(features: int) -> pyarrow.Table:
+    """Random small polygons with a few low and high cardinality property columns."""
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 100, size=(features, 2))
+    polygons = shapely.buffer(shapely.points(centers), 0.05, quad_segs=4)
+    return pyarrow.table(
+        {
+            "geometry": shapely.to_wkb(polygons),
+            "category": rng.choice(
+                ["residential", "commercial", "industrial"], features
+            ),
+            "height": rng.integers(0, 50, features),
+            "name": [f"building_{i}" for i in range(features)],
+        }
+    ).replace_schema_metadata(
+        _encode_metadata(
+            {
+                "geo": {
+                    "version": "1.1.0",
+                    "primary_column": "geometry",
+                    "columns": {
+                        "geometry": {"encoding": "WKB", "geometry_types": ["Polygon"]},
+                    },
+                },
+            }
+        )
+    )
+
+
+def spatial_read(path: Path, bbox: tuple[float, float, float, float]) -> int:
+    xmin, ymin, xmax, ymax = bbox
+    schema = pyarrow.parquet.read_schema(path)
+    if "bbox" in schema.names:
+        field = pyarrow.dataset.field
+        table = pyarrow.dataset.dataset(path).to_table(
+            filter=(field("bbox", "xmin") <= xmax)
+            & (field("bbox", "xmax") >= xmin)
+            & (field("bbox", "ymin") <= ymax)
+            & (field("bbox", "ymax") >= ymin),
+        )
+    else:
+        table = pyarrow.parquet.read_table(path)
+    geometries = shapely.from_wkb(table.column("geometry").to_numpy())
+    return int(shapely.intersects(geometries, shapely.box(*bbox)).sum())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--features", type=int, default=200_000)
+    args = parser.parse_args()
+
+    table = make_table(args.features)
+    print(f"{args.features} features, {table.nbytes / 1024**2:.1f}MB in memory")
+    print(
+        f"{'preset':<18} {'write':>8} {'size':>9} {'row groups':>11} "
+        f"{'full read':>10} {'bbox read':>10}"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for preset in WRITE_PRESETS:
+            path = Path(temp_dir) / f"{preset}.parquet"
+            start = time.perf_counter()
+            write_geoparquet(table, path, preset=preset)
+            write_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            pyarrow.parquet.read_table(path)
+            read_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            spatial_read(path, (40, 40, 50, 50))
+            spatial_read_time = time.perf_counter() - start
+
+            size = path.stat().st_size / 1024**2
+            num_row_groups = pyarrow.parquet.ParquetFile(path).num_row_groups
+            print(
+                f"{preset:<18} {write_time:7.3f}s {size:7.1f}MB {num_row_groups:>11} "
+                f"{read_time:9.3f}s {spatial_read_time:9.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,29 @@ from .schemas import (
     GeoParquetMetadata,
 )
 from .convert import (
+    GeoParquetConverter,
     geojson_to_geoparquet,
+    geojson_to_geoparquet_reader,
     geoparquet_to_geojson,
+    geoparquet_to_geojson_file,
+    iter_geojson_features,
+)
+from .json_backend import (
+    set_json_backend,
+    get_json_backend,
 )
 from .validate import (
     validate_geoparquet_table,
     validate_geoparquet_file,
 )
+from .write import (
+    write_geoparquet,
+)
+from .dataset import (
+    append_to_geoparquet_dataset,
+)
+from .index import (
+    SpatialIndex,
+    build_spatial_index,
+    load_spatial_index,
+)
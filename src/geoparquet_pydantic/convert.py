@@ -1,12 +1,19 @@
 import ast
+import collections
+import concurrent.futures
 import functools
+import os
 import warnings
 import geojson_pydantic
+import numpy as np
 from geojson_pydantic.types import BBox
-import shapely.wkb
-import shapely.wkt
+import shapely
 import pyarrow
-import json
+import pyarrow.compute
+import pyarrow.dataset
+import pyarrow.parquet
+import pyproj
+from pydantic import BaseModel
 from geojson_pydantic.geometries import (
     _GeometryBase,
 )
@@ -14,57 +21,389 @@ from geojson_pydantic.features import (
     Feature,
     FeatureCollection,
 )
+from geoparquet_pydantic import json_backend
 from geoparquet_pydantic.schemas import (
     GeometryColumnMetadata,
     GeoParquetMetadata,
     GeometryTypes,
 )
 from pathlib import Path
-from typing import Any, Optional, Iterable
+from typing import Any, Callable, Optional, Iterable, Iterator, Protocol
 
 
-def _to_wkb(geometry: _GeometryBase) -> bytes:
-    """Converts the GeoJSON object to WKB format."""
-    return shapely.wkb.dumps(shapely.wkt.loads(geometry.wkt))
+class ArrowStreamExportable(Protocol):
+    """Any object implementing the Arrow PyCapsule stream protocol."""
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object: ...
+
+
+def _geojson_to_shapely(geometries: Iterable[BaseModel | dict | None]) -> np.ndarray:
+    """Parses GeoJSON geometries (pydantic models or dicts) to shapely, vectorized."""
+    return shapely.from_geojson(
+        [
+            (
+                g.model_dump_json(exclude_none=True)
+                if isinstance(g, BaseModel)
+                else None if g is None else json_backend.dumps(g)
+            )
+            for g in geometries
+        ]
+    )
+
+
+def _geojson_to_wkb(
+    geometries: Iterable[BaseModel | dict | None],
+    transformer: Optional[pyproj.Transformer] = None,
+) -> tuple[list[bytes | None], np.ndarray]:
+    """Converts GeoJSON geometries (pydantic models or dicts) to WKB, vectorized with
+    shapely, optionally reprojecting them.
+
+    The GeoJSON parse and WKB encoding release the GIL, so chunks can be encoded in
+    parallel threads.
+
+    Returns:
+        The WKB values, and the (reprojected) shapely geometries they were encoded from.
+    """
+    geometries = _geojson_to_shapely(geometries)
+    if transformer is not None:
+        geometries = _transform_geometries(geometries, transformer)
+    return shapely.to_wkb(geometries).tolist(), geometries
+
+
+# the nesting depth of each geometry type's coordinates, above the positions
+_COORDINATE_DEPTHS: dict[str, int] = {
+    "Point": 0,
+    "MultiPoint": 1,
+    "LineString": 1,
+    "Polygon": 2,
+    "MultiLineString": 2,
+    "MultiPolygon": 3,
+}
+
+# the single part geometry type of each multi part geometry type
+_PART_TYPES: dict[str, str] = {
+    "MultiPoint": "Point",
+    "MultiLineString": "LineString",
+    "MultiPolygon": "Polygon",
+}
+
+
+def _get_wkb_size(geometry_type: str, coordinates: Any, dimensions: int) -> int:
+    """Gets the WKB size of a (non collection) geometry from its coordinates.
+
+    Every geometry has a 5 byte header (byte order + geometry type), and a 4 byte count
+    of its points, rings or parts (except points). Each ring has its own 4 byte point
+    count, and each part of a multi geometry its own header and count.
+    """
+    if geometry_type == "Point":
+        return 5 + 8 * dimensions
+    if geometry_type == "LineString":
+        return 9 + 8 * dimensions * len(coordinates)
+    if geometry_type == "Polygon":
+        return 9 + sum(4 + 8 * dimensions * len(ring) for ring in coordinates)
+    part_type = _PART_TYPES[geometry_type]
+    return 9 + sum(_get_wkb_size(part_type, part, dimensions) for part in coordinates)
+
+
+def _estimate_wkb_size(geometry: _GeometryBase | None) -> int:
+    """Computes the WKB size of a GeoJSON geometry from its vertex and part counts,
+    without encoding it.
+
+    Exact for geometries whose positions all have the same dimension.
+    """
+    if geometry is None:
+        return 0
+    if geometry.type == "GeometryCollection":
+        return 9 + sum(map(_estimate_wkb_size, geometry.geometries))
+    return _get_wkb_size(
+        geometry.type,
+        geometry.coordinates,
+        _get_dimensions(geometry),
+    )
+
+
+def _get_dimensions(geometry: _GeometryBase) -> int:
+    """Gets the coordinate dimension of a GeoJSON geometry from its first position,
+    without iterating the others."""
+    if geometry.type == "GeometryCollection":
+        return max(map(_get_dimensions, geometry.geometries), default=2)
+    position = geometry.coordinates
+    for _ in range(_COORDINATE_DEPTHS[geometry.type]):
+        position = next((c for c in position if len(c)), None)
+        if position is None:
+            break
+    return max(len(position), 2) if position else 2
 
 
 def _get_geom_types(features: list[Feature]) -> list[str]:
-    return list(set([feature.geometry.type for feature in features]))
+    """Gets the GeoParquet geometry type names (with a Z suffix if 3D) of the features
+    from their pydantic models, without parsing the geometries."""
+    return sorted(
+        {
+            f.geometry.type + ("Z" if _get_dimensions(f.geometry) > 2 else "")
+            for f in features
+            if f.geometry is not None
+        }
+    )
+
+
+# see shapely.get_type_id()
+_SHAPELY_TYPE_NAMES: dict[int, str] = {
+    0: "Point",
+    1: "LineString",
+    2: "LineString",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+    7: "GeometryCollection",
+}
+
+
+def _get_geometry_type_names(geometries: np.ndarray) -> set[str]:
+    """Gets the GeoParquet geometry type names (with a Z suffix if 3D) of an array of
+    shapely geometries, ignoring missing geometries."""
+    type_ids = shapely.get_type_id(geometries)
+    has_z = shapely.has_z(geometries)
+    type_names = set()
+    for type_id, z in set(zip(type_ids[type_ids >= 0].tolist(), has_z[type_ids >= 0])):
+        type_names.add(_SHAPELY_TYPE_NAMES[type_id] + ("Z" if z else ""))
+    return type_names
+
+
+def _get_bbox(geometries: np.ndarray) -> list[float] | None:
+    """Gets the [xmin, ymin, xmax, ymax] bounding box of an array of shapely geometries.
+
+    Returns None if there are no non-empty geometries.
+    """
+    bounds = shapely.bounds(geometries)
+    # missing and empty geometries have all NaN bounds
+    bounds = bounds[~np.isnan(bounds[:, 0])]
+    if not len(bounds):
+        return None
+    return [
+        *bounds[:, :2].min(axis=0).tolist(),
+        *bounds[:, 2:].max(axis=0).tolist(),
+    ]
 
 
 def _get_default_geo_metadata(
     feature_collection: FeatureCollection,
+    primary_column: str = "geometry",
+    geometry_types: Optional[list[str]] = None,
 ) -> GeoParquetMetadata:
+    if geometry_types is None:
+        # the same (Z suffixed) type names that deep validation derives
+        geometry_types = _get_geom_types(feature_collection.features)
     return GeoParquetMetadata(
-        primary_column="geometry",
+        primary_column=primary_column,
         columns={
-            "geometry": GeometryColumnMetadata(
+            primary_column: GeometryColumnMetadata(
                 **{
                     "encoding": "WKB",
-                    "geometry_types": _get_geom_types(feature_collection.features),
+                    "geometry_types": geometry_types,
                 }
             ),
         },
     )
 
 
+def _encode_metadata(metadata: dict) -> dict[bytes, bytes]:
+    return {
+        k.encode("utf-8"): json_backend.dumps(v).encode("utf-8")
+        for k, v in metadata.items()
+    }
+
+
+def _decode_geo_metadata(metadata: dict[bytes, bytes]) -> dict[str, Any]:
+    """Decodes the b'geo' key of Arrow schema metadata.
+
+    GeoParquet metadata is JSON, but python literal strings are still accepted.
+    """
+    geo_metadata = metadata[b"geo"].decode("utf-8")
+    try:
+        return json_backend.loads(geo_metadata)
+    except ValueError:
+        return ast.literal_eval(geo_metadata)
+
+
+def _get_max_workers(max_workers: Optional[int]) -> int:
+    """Returns the number of workers to use, where 0 means running sequentially."""
+    if not max_workers:
+        return 0
+    if max_workers == -1:
+        return os.cpu_count() or 1
+    if max_workers < 0:
+        raise ValueError("param:max_workers must be a positive integer, 0, or -1")
+    return max_workers
+
+
+def _map_in_order(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+) -> Iterator[Any]:
+    """Lazily maps a function over items in a thread pool, yielding results in order.
+
+    Items are only pulled as the oldest result is yielded, so at most param:max_workers
+    items (i.e., decompressed row groups of a lazy stream) are held in memory at once.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        pending: collections.deque[concurrent.futures.Future] = collections.deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_transformer(source_crs: str, target_crs: str) -> pyproj.Transformer:
+    """Gets a cached transformer between two CRS, always in x/y (lon/lat) order.
+
+    Transformers are thread-safe, so one instance is shared by every batch and worker.
+    """
+    try:
+        return pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+    except pyproj.exceptions.CRSError as e:
+        raise ValueError(f"Invalid CRS: {e}")
+
+
+def _get_column_crs(schema: pyarrow.Schema, column: str) -> str:
+    """Gets the CRS of a geometry column from the geo metadata (default OGC:CRS84)."""
+    if not schema.metadata or b"geo" not in schema.metadata:
+        return "OGC:CRS84"
+    column_metadata = _decode_geo_metadata(schema.metadata)["columns"].get(column, {})
+    crs = column_metadata.get("crs", "OGC:CRS84")
+    if crs is None:
+        raise ValueError(
+            f"Cannot reproject column={column} with an unknown (null) crs."
+        )
+    return crs if isinstance(crs, str) else json_backend.dumps(crs)
+
+
+def _transform_geometries(
+    geometries: np.ndarray,
+    transformer: pyproj.Transformer,
+) -> np.ndarray:
+    """Reprojects geometries, vectorized over all of their coordinates at once."""
+
+    def _transform(coordinates: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(*coordinates.T))
+
+    has_z = shapely.has_z(geometries)
+    transformed = np.empty_like(geometries)
+    transformed[~has_z] = shapely.transform(geometries[~has_z], _transform)
+    transformed[has_z] = shapely.transform(
+        geometries[has_z],
+        _transform,
+        include_z=True,
+    )
+    return transformed
+
+
+def _transform_bbox(
+    bbox: list[float] | tuple[float, ...] | None,
+    transformer: pyproj.Transformer,
+) -> list[float] | None:
+    """Reprojects a 2D bbox (densifying its edges), so it still covers the geometries."""
+    if not bbox:
+        return None
+    return list(transformer.transform_bounds(*bbox))
+
+
+def _get_transformers(
+    schema: pyarrow.Schema,
+    columns: list[str],
+    target_crs: Optional[str],
+) -> dict[str, pyproj.Transformer]:
+    """Gets the transformers from each geometry column's CRS to param:target_crs."""
+    if not target_crs:
+        return {}
+    return {
+        column: _get_transformer(_get_column_crs(schema, column), target_crs)
+        for column in columns
+    }
+
+
+def _reproject_geo_metadata(
+    geo_metadata: GeoParquetMetadata,
+    target_crs: str,
+) -> tuple[GeoParquetMetadata, dict[str, pyproj.Transformer]]:
+    """Gets the transformers from each geometry column's CRS to param:target_crs, and
+    the geo metadata with every column's crs and bbox updated."""
+    transformers: dict[str, pyproj.Transformer] = {}
+    columns = dict(geo_metadata.columns)
+    for name, column_metadata in geo_metadata.columns.items():
+        if not isinstance(column_metadata, GeometryColumnMetadata):
+            continue
+        transformers[name] = _get_transformer(column_metadata.crs, target_crs)
+        columns[name] = GeometryColumnMetadata(
+            **{
+                **column_metadata.model_dump(),
+                "crs": target_crs,
+                "bbox": _transform_bbox(column_metadata.bbox, transformers[name]),
+            }
+        )
+    return geo_metadata.model_copy(update={"columns": columns}), transformers
+
+
+def _fill_geo_metadata(
+    geo_metadata: dict[str, Any],
+    geometries: dict[str, np.ndarray],
+) -> dict[str, Any]:
+    """Fills in the missing bbox and empty geometry_types of each geometry column of a
+    dumped geo metadata dict, from the shapely geometries they were encoded from.
+
+    Returns param:geo_metadata itself if nothing is missing, otherwise a copy.
+    """
+    columns: dict[str, Any] | None = None
+    for name, column_geometries in geometries.items():
+        column_metadata = geo_metadata["columns"][name]
+        update: dict[str, Any] = {}
+        if column_metadata.get("bbox") is None:
+            update["bbox"] = _get_bbox(column_geometries)
+        if not column_metadata.get("geometry_types"):
+            update["geometry_types"] = sorted(
+                _get_geometry_type_names(column_geometries)
+            )
+        if update:
+            columns = columns or dict(geo_metadata["columns"])
+            columns[name] = {**column_metadata, **update}
+    if columns is None:
+        return geo_metadata
+    return {**geo_metadata, "columns": columns}
+
+
+def _get_secondary_columns(
+    geo_metadata: GeoParquetMetadata,
+    primary_column: str,
+) -> list[str]:
+    """Gets the geometry columns other than the primary column from the geo metadata."""
+    return [
+        name
+        for name in geo_metadata.columns.keys()
+        if name not in (primary_column, geo_metadata.primary_column)
+    ]
+
+
 def _update_metadata(table: pyarrow.Table, metadata: dict) -> pyarrow.Table:
     new_metadata = table.schema.metadata
     if not new_metadata:
         new_metadata = {}
-    for k, v in metadata.items():
-        new_metadata[k] = json.dumps(v).encode("utf-8")
+    new_metadata.update(_encode_metadata(metadata))
     return table.replace_schema_metadata(new_metadata)
 
 
-def _validate_column_schema(
+def _validate_feature_properties(
     column_schema: pyarrow.Schema,
     primary_column: str,
-    geojson: FeatureCollection,
+    features: list[Feature],
     add_none_values: bool,
 ) -> None:
     names = [i for i in column_schema.names if i != primary_column]
-    for feature in geojson.features:
+    for feature in features:
         if not add_none_values:
             all_present = all([name in feature.properties.keys() for name in names])
             if not all_present:
@@ -78,18 +417,174 @@ def _validate_column_schema(
                     feature.properties[name] = None
 
 
+def _load_geojson(geojson: FeatureCollection | Path) -> FeatureCollection:
+    if not isinstance(geojson, FeatureCollection):
+        geojson = FeatureCollection(**json_backend.loads(geojson.read_bytes()))
+    return geojson
+
+
+def _get_geo_metadata(
+    geojson: FeatureCollection,
+    geo_metadata: GeoParquetMetadata | dict | None,
+    primary_column: str = "geometry",
+) -> GeoParquetMetadata:
+    if not geo_metadata:
+        geo_metadata = _get_default_geo_metadata(geojson, primary_column)
+    if isinstance(geo_metadata, dict):
+        geo_metadata = GeoParquetMetadata(**geo_metadata)
+    if not isinstance(geo_metadata, GeoParquetMetadata):
+        raise ValueError("geo_metadata must be a valid GeoParquet class, dict, or None")
+    return geo_metadata
+
+
+def _get_column_schema(
+    column_schema: pyarrow.Schema | None,
+    primary_column: str,
+    geometry_columns: Optional[list[str]] = None,
+) -> pyarrow.Schema:
+    if not column_schema:
+        column_schema = pyarrow.schema(
+            [
+                (primary_column, pyarrow.binary()),
+                ("properties", pyarrow.string()),
+            ]
+        )
+    elif isinstance(column_schema, pyarrow.Schema):
+        if primary_column in column_schema.names:
+            column_schema = column_schema.remove(
+                column_schema.get_field_index(primary_column)
+            )
+        column_schema = column_schema.insert(
+            0, pyarrow.field(primary_column, pyarrow.binary())
+        )
+    else:
+        raise ValueError("column_schema must be a valid pyarrow.Schema or None")
+
+    if "properties" in column_schema.names and len(column_schema.names) > 2:
+        raise ValueError(
+            "Cannot have 'properties' as a column with other columns (which are pulled from GeoJSON propreties)."
+        )
+
+    # secondary geometry columns are pulled from GeoJSON properties, and stored as WKB
+    for name in geometry_columns or []:
+        if name not in column_schema.names:
+            raise ValueError(
+                f"Geometry column={name} from the geo metadata not found in param:column_schema."
+            )
+        column_schema = column_schema.set(
+            column_schema.get_field_index(name),
+            pyarrow.field(name, pyarrow.binary()),
+        )
+    return column_schema
+
+
+def _features_to_columns(
+    features: list[Feature],
+    column_schema: pyarrow.Schema,
+    primary_column: str,
+    add_none_values: bool,
+    transformers: Optional[dict[str, pyproj.Transformer]] = None,
+    geometry_columns: Optional[list[str]] = None,
+) -> tuple[dict[str, Iterable], dict[str, np.ndarray]]:
+    """Gets the column iterables of a list of features, keyed by column name, and the
+    shapely geometries of each geometry column (to fill in their metadata).
+
+    Secondary geometry columns in param:geometry_columns are encoded to WKB from the
+    GeoJSON geometry objects in the feature properties.
+    """
+    transformers = transformers or {}
+
+    # get primary column as iterables
+    columns: dict[str, Iterable] = {}
+    geometries: dict[str, np.ndarray] = {}
+    columns[primary_column], geometries[primary_column] = _geojson_to_wkb(
+        [f.geometry for f in features],
+        transformers.get(primary_column),
+    )
+
+    # get other columns as iterables
+    if "properties" in column_schema.names:
+        columns["properties"] = map(
+            lambda f: json_backend.dumps(f.properties), features
+        )
+    else:
+        _validate_feature_properties(
+            column_schema,
+            primary_column,
+            features,
+            add_none_values,
+        )
+        for col in column_schema.names[1:]:
+            if col in (geometry_columns or []):
+                columns[col], geometries[col] = _geojson_to_wkb(
+                    [f.properties.get(col) for f in features],
+                    transformers.get(col),
+                )
+            else:
+                columns[col] = map(lambda f, c=col: f.properties.get(c), features)
+    return columns, geometries
+
+
+def _features_to_table_parallel(
+    features: list[Feature],
+    column_schema: pyarrow.Schema,
+    primary_column: str,
+    add_none_values: bool,
+    max_workers: int,
+    transformers: Optional[dict[str, pyproj.Transformer]] = None,
+    geometry_columns: Optional[list[str]] = None,
+    **kwargs,
+) -> tuple[pyarrow.Table, dict[str, np.ndarray]]:
+    """Encodes chunks of features to record batches in a thread pool, and assembles
+    them (and each geometry column's shapely geometries) in the original feature
+    order."""
+    # a few chunks per worker, so that uneven chunks still keep every worker busy
+    chunk_size = max(1, -(-len(features) // (max_workers * 4)))
+
+    def _chunk_to_batch(
+        i: int,
+    ) -> tuple[pyarrow.RecordBatch, dict[str, np.ndarray]]:
+        columns, geometries = _features_to_columns(
+            features[i : i + chunk_size],
+            column_schema,
+            primary_column,
+            add_none_values,
+            transformers,
+            geometry_columns,
+        )
+        batch = pyarrow.RecordBatch.from_pydict(columns, schema=column_schema, **kwargs)
+        return batch, geometries
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        results = list(
+            executor.map(_chunk_to_batch, range(0, len(features), chunk_size))
+        )
+    if not results:
+        return column_schema.empty_table(), {
+            name: np.array([], dtype=object)
+            for name in [primary_column, *(geometry_columns or [])]
+        }
+    batches, geometries = zip(*results)
+    return pyarrow.Table.from_batches(batches), {
+        name: np.concatenate([g[name] for g in geometries]) for name in geometries[0]
+    }
+
+
 def geojson_to_geoparquet(
     geojson: FeatureCollection | Path,
     primary_column: Optional[str] = None,
     column_schema: Optional[pyarrow.Schema] = None,
     add_none_values: Optional[bool] = False,
     geo_metadata: GeoParquetMetadata | dict | None = None,
+    max_workers: Optional[int] = None,
+    target_crs: Optional[str] = None,
     **kwargs,
 ) -> pyarrow.Table:
     """Converts a GeoJSON Pydantic FeatureCollection to an Arrow table with geoparquet
     metadata.
 
-    To save to a file, simply use pyarrow.parquet.write_table() on the returned table.
+    To save to a file, use write_geoparquet() or pyarrow.parquet.write_table() on the
+    returned table.
 
     Args:
         geojson (FeatureCollection): The GeoJSON Pydantic FeatureCollection.
@@ -98,163 +593,861 @@ def geojson_to_geoparquet(
         add_none_values (bool, default=False): Whether to fill missing column values
             specified in param:column_schema with 'None' (converts to pyarrow.null()).
         geo_metadata (GeoParquet | dict | None, optional): The GeoParquet metadata.
+        max_workers (int, optional): The maximum number of threads used to encode chunks
+            of features in parallel. Defaults to 0 (runs sequentially). Use -1 for all
+            available cores.
+        target_crs (str, optional): Reproject the geometries from each geometry column's
+            crs to this CRS (any string readable by pyproj), updating the crs and bbox
+            metadata. Defaults to None (no reprojection).
         **kwargs: Additional keyword arguments for the Arrow table writer.
 
+    Note:
+        Secondary geometry columns declared in param:geo_metadata are read from GeoJSON
+        geometry objects in the feature properties, and must be in param:column_schema.
+        Missing bboxes and geometry types are computed for every geometry column.
+
     Returns:
         The Arrow table with GeoParquet metadata.
     """
-    if not isinstance(geojson, FeatureCollection):
-        geojson = FeatureCollection(**json.load(geojson.open("r")))
+    geojson = _load_geojson(geojson)
     if not primary_column:
         primary_column = "geometry"
 
-    # get primary column as iterables
-    columns: list[Iterable] = [map(lambda f: _to_wkb(f.geometry), geojson.features)]
-
-    # get geo metadata
+    # get geo metadata and the full column schema
     if not geo_metadata:
-        geo_metadata = _get_default_geo_metadata(geojson)
-    if isinstance(geo_metadata, dict):
-        geo_metadata = GeoParquetMetadata(**geo_metadata)
-    if not isinstance(geo_metadata, GeoParquetMetadata):
-        raise ValueError("geo_metadata must be a valid GeoParquet class, dict, or None")
+        # the geometry types are filled in from the encoded geometries below
+        geo_metadata = _get_default_geo_metadata(geojson, primary_column, [])
+    geo_metadata = _get_geo_metadata(geojson, geo_metadata, primary_column)
+    geometry_columns = _get_secondary_columns(geo_metadata, primary_column)
+    column_schema = _get_column_schema(column_schema, primary_column, geometry_columns)
+    transformers = None
+    if target_crs:
+        geo_metadata, transformers = _reproject_geo_metadata(geo_metadata, target_crs)
 
-    # get other columns as iterables and update schema
-    if not column_schema:
-        column_schema = pyarrow.schema(
-            [
-                (primary_column, pyarrow.binary()),
-                ("properties", pyarrow.string()),
-            ]
+    # write table
+    max_workers = _get_max_workers(max_workers)
+    if not max_workers:
+        columns, geometries = _features_to_columns(
+            geojson.features,
+            column_schema,
+            primary_column,
+            add_none_values,
+            transformers,
+            geometry_columns,
         )
-    elif isinstance(column_schema, pyarrow.Schema):
-        if primary_column in column_schema.names:
-            column_schema.remove(column_schema.get_field_index(primary_column))
-        column_schema.insert(0, pyarrow.field(primary_column, pyarrow.binary()))
+        table = pyarrow.Table.from_pydict(columns, schema=column_schema, **kwargs)
     else:
-        raise ValueError("column_schema must be a valid pyarrow.Schema or None")
+        table, geometries = _features_to_table_parallel(
+            geojson.features,
+            column_schema,
+            primary_column,
+            add_none_values,
+            max_workers,
+            transformers,
+            geometry_columns,
+            **kwargs,
+        )
+    return _update_metadata(
+        table,
+        {"geo": _fill_geo_metadata(geo_metadata.model_dump(), geometries)},
+    )
 
-    if "properties" in column_schema.names:
-        if len(column_schema.names) > 2:
-            raise ValueError(
-                "Cannot have 'properties' as a column with other columns (which are pulled from GeoJSON propreties)."
-            )
-        columns.append(map(lambda f: json.dumps(f.properties), geojson.features))
 
-    else:
-        _validate_column_schema(column_schema, primary_column, geojson, add_none_values)
+def geojson_to_geoparquet_reader(
+    geojson: FeatureCollection | Path,
+    primary_column: Optional[str] = None,
+    column_schema: Optional[pyarrow.Schema] = None,
+    add_none_values: Optional[bool] = False,
+    geo_metadata: GeoParquetMetadata | dict | None = None,
+    batch_size: Optional[int] = None,
+    max_batch_bytes: Optional[int] = None,
+) -> pyarrow.RecordBatchReader:
+    """Converts a GeoJSON Pydantic FeatureCollection to a stream of Arrow record
+    batches with geoparquet metadata.
 
-        for col in column_schema.names:
-            columns.append(map(lambda f: f.properties.get(col), geojson.features))
+    Batches are only converted as they are read, so the full Arrow table never exists
+    in memory. The batches can be written one at a time with a
+    pyarrow.parquet.ParquetWriter, or the reader passed to Arrow Flight, DuckDB, etc.
 
-    # write table
-    table = pyarrow.Table.from_pydict(
-        {**dict(zip(column_schema.names, columns))},
-        schema=column_schema,
-        **kwargs,
+    Args:
+        geojson (FeatureCollection): The GeoJSON Pydantic FeatureCollection.
+        primary_column (str, optional): The name of the primary column. Defaults to None.
+        column_schema (pyarrow.Schema, optional): The Arrow schema for the table. Defaults to None.
+        add_none_values (bool, default=False): Whether to fill missing column values
+            specified in param:column_schema with 'None' (converts to pyarrow.null()).
+        geo_metadata (GeoParquet | dict | None, optional): The GeoParquet metadata.
+        batch_size (int, optional): The number of features per record batch.
+            Defaults to 1000, or no limit if param:max_batch_bytes is set.
+        max_batch_bytes (int, optional): The maximum WKB bytes per record batch,
+            computed from each geometry's vertex and part counts, to keep peak memory
+            predictable for large geometries. Defaults to None.
+
+    Returns:
+        A pyarrow.RecordBatchReader whose schema carries the GeoParquet metadata.
+    """
+    geojson = _load_geojson(geojson)
+    if not primary_column:
+        primary_column = "geometry"
+    if not batch_size and not max_batch_bytes:
+        batch_size = 1000
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("param:batch_size must be a positive integer")
+    if max_batch_bytes is not None and max_batch_bytes < 1:
+        raise ValueError("param:max_batch_bytes must be a positive integer")
+
+    geo_metadata = _get_geo_metadata(geojson, geo_metadata, primary_column)
+    geometry_columns = _get_secondary_columns(geo_metadata, primary_column)
+    column_schema = _get_column_schema(column_schema, primary_column, geometry_columns)
+    reader_schema = column_schema.with_metadata(
+        _encode_metadata({"geo": geo_metadata.model_dump()}),
     )
-    return _update_metadata(table, {"geo": geo_metadata.model_dump()})
 
+    def _iter_feature_chunks() -> Iterator[list[Feature]]:
+        features = geojson.features
+        if not max_batch_bytes:
+            for i in range(0, len(features), batch_size):
+                yield features[i : i + batch_size]
+            return
 
-def _find_bbox(geoparquet: pyarrow.Table) -> BBox | None:
-    if not geoparquet.schema.metadata:
+        chunk: list[Feature] = []
+        chunk_bytes = 0
+        for feature in features:
+            feature_bytes = _estimate_wkb_size(feature.geometry)
+            if chunk and (
+                chunk_bytes + feature_bytes > max_batch_bytes
+                or len(chunk) == batch_size
+            ):
+                yield chunk
+                chunk, chunk_bytes = [], 0
+            chunk.append(feature)
+            chunk_bytes += feature_bytes
+        if chunk:
+            yield chunk
+
+    def _iter_batches() -> Iterator[pyarrow.RecordBatch]:
+        for chunk in _iter_feature_chunks():
+            columns, _ = _features_to_columns(
+                chunk,
+                column_schema,
+                primary_column,
+                add_none_values,
+                geometry_columns=geometry_columns,
+            )
+            yield pyarrow.RecordBatch.from_pydict(columns, schema=reader_schema)
+
+    return pyarrow.RecordBatchReader.from_batches(reader_schema, _iter_batches())
+
+
+def _find_bbox(
+    schema: pyarrow.Schema,
+    primary_column: Optional[str] = None,
+) -> BBox | None:
+    if not schema.metadata or b"geo" not in schema.metadata:
         warnings.warn("No GeoParquet metadata found in the Arrow table.")
         return None
-    decoded_metadata: dict[str, Any] = ast.literal_eval(
-        geoparquet.schema.metadata[b"geo"].decode("utf-8"),
+    decoded_metadata: dict[str, Any] = _decode_geo_metadata(
+        schema.metadata,
     )
-    bbox = decoded_metadata["columns"]["geometry"].get("bbox", None)
+    if not primary_column:
+        primary_column = decoded_metadata.get("primary_column", "geometry")
+    column_metadata = decoded_metadata["columns"].get(primary_column) or {}
+    bbox = column_metadata.get("bbox", None)
     if isinstance(bbox, list):
         bbox = tuple(bbox)
     return bbox
 
 
-def _get_prop_records(name_value_tuple: tuple[str, list[Any]]) -> list[tuple[str, Any]]:
-    name, values = name_value_tuple
-    return list(zip([name] * len(values), values))
+def _get_geometry_columns(
+    schema: pyarrow.Schema,
+    primary_column: str,
+) -> tuple[list[str], list[str]]:
+    """Gets the secondary geometry columns and the covering columns declared in the
+    geo metadata of a schema."""
+    if not schema.metadata or b"geo" not in schema.metadata:
+        return [], []
+    columns_metadata = _decode_geo_metadata(schema.metadata)["columns"]
+    geometry_columns: list[str] = []
+    covering_columns: list[str] = []
+    for name, column_metadata in columns_metadata.items():
+        if name != primary_column and name in schema.names:
+            geometry_columns.append(name)
+        for covering in (column_metadata.get("covering") or {}).values():
+            for path in covering.values():
+                if path[0] in schema.names and path[0] not in covering_columns:
+                    covering_columns.append(path[0])
+    return geometry_columns, covering_columns
+
+
+def _get_arrow_stream(
+    geoparquet: pyarrow.Table | pyarrow.RecordBatchReader | ArrowStreamExportable,
+) -> tuple[pyarrow.Schema, Iterable[pyarrow.RecordBatch]]:
+    """Gets the schema and a lazy record batch iterable of an Arrow input.
+
+    Anything implementing the Arrow PyCapsule stream protocol (i.e., DuckDB or Polars
+    results) is imported as a RecordBatchReader without copying.
+    """
+    if isinstance(geoparquet, pyarrow.Table):
+        return geoparquet.schema, geoparquet.to_batches()
+    if isinstance(geoparquet, pyarrow.RecordBatchReader):
+        return geoparquet.schema, geoparquet
+    if hasattr(geoparquet, "__arrow_c_stream__"):
+        reader = pyarrow.RecordBatchReader.from_stream(geoparquet)
+        return reader.schema, reader
+    raise ValueError(
+        "Input must be a pyarrow.Table, pyarrow.RecordBatchReader, or implement __arrow_c_stream__"
+    )
+
+
+def _slice_batches(
+    batches: Iterable[pyarrow.RecordBatch],
+    max_chunksize: Optional[int],
+    max_batch_bytes: Optional[int] = None,
+    primary_column: Optional[str] = None,
+) -> Iterator[pyarrow.RecordBatch]:
+    """Yields zero-copy slices of each batch with at most max_chunksize rows, and at
+    most max_batch_bytes of primary column WKB (or a single row if it is larger)."""
+    for batch in batches:
+        if not max_batch_bytes:
+            for offset in range(0, len(batch), max_chunksize):
+                yield batch.slice(offset, max_chunksize)
+            continue
+
+        # binary_length has no binary_view kernel (i.e., columns exported by Polars)
+        wkb_bytes = np.cumsum(
+            pyarrow.compute.binary_length(
+                batch.column(primary_column).cast(pyarrow.large_binary())
+            )
+            .fill_null(0)
+            .to_numpy()
+        )
+        start = 0
+        while start < len(batch):
+            start_bytes = wkb_bytes[start - 1] if start else 0
+            end = int(
+                np.searchsorted(wkb_bytes, start_bytes + max_batch_bytes, side="right")
+            )
+            end = max(end, start + 1)
+            if max_chunksize:
+                end = min(end, start + max_chunksize)
+            yield batch.slice(start, end - start)
+            start = end
+
+
+def _batch_to_records(
+    chunk: pyarrow.RecordBatch,
+    primary_column: str,
+    geometry_columns: Optional[dict[str, list]] = None,
+) -> list[dict[str, Any]]:
+    """Converts the non-primary columns of a record batch to one properties dict per
+    row.
+
+    Each column is converted to python once, and each row's dict is built once by
+    zipping the column names with that row's values. Secondary geometry columns take
+    their already decoded values from param:geometry_columns.
+    """
+    chunk = chunk.drop_columns([primary_column])
+    if not chunk.num_columns:
+        return [{} for _ in range(chunk.num_rows)]
+    geometry_columns = geometry_columns or {}
+    names = chunk.schema.names
+    columns = [
+        geometry_columns[name] if name in geometry_columns else column.to_pylist()
+        for name, column in zip(names, chunk.columns)
+    ]
+    return [dict(zip(names, row)) for row in zip(*columns)]
 
 
 def _shapely_to_feature(
     geometry: shapely.geometry.base.BaseGeometry,
-    properties: list[tuple[str, Any]],
+    geometry_json: str,
+    bounds: list[float],
+    properties: dict[str, Any],
 ) -> Feature:
     geom_class: type[GeometryTypes] = getattr(geojson_pydantic, type(geometry).__name__)
     return Feature(
         type="Feature",
-        geometry=geom_class(**json.loads(shapely.to_geojson(geometry))),
-        bbox=list(geometry.bounds),
-        properties=dict([*properties]),
+        geometry=geom_class(**json_backend.loads(geometry_json)),
+        bbox=bounds,
+        properties=properties,
+    )
+
+
+def _batch_to_geometries(
+    chunk: pyarrow.RecordBatch,
+    column: str,
+    simplify_tolerance: Optional[float] = None,
+    coordinate_precision: Optional[int] = None,
+    transformer: Optional[pyproj.Transformer] = None,
+) -> np.ndarray:
+    """Decodes a geometry column of a record batch to shapely geometries, optionally
+    reprojected, simplified and rounded (all vectorized over the whole batch)."""
+    try:
+        geoms = shapely.from_wkb(
+            chunk.column(column).to_numpy(zero_copy_only=False),
+        )
+    except shapely.errors.GEOSException as e:
+        raise ValueError(
+            f"Error converting WKB to shapely geometry. Make sure the WKB is valid! Exception: {e}"
+        )
+    if transformer is not None:
+        geoms = _transform_geometries(geoms, transformer)
+    if simplify_tolerance:
+        geoms = shapely.simplify(geoms, simplify_tolerance)
+    if coordinate_precision is not None:
+        geoms = shapely.set_precision(
+            geoms,
+            10.0**-coordinate_precision,
+            mode="pointwise",
+        )
+    return geoms
+
+
+def _batch_to_geometry_dicts(
+    chunk: pyarrow.RecordBatch,
+    geometry_columns: list[str],
+    simplify_tolerance: Optional[float] = None,
+    coordinate_precision: Optional[int] = None,
+    transformers: Optional[dict[str, pyproj.Transformer]] = None,
+) -> dict[str, list[dict | None]]:
+    """Decodes the secondary geometry columns of a record batch to GeoJSON geometry
+    dicts, keyed by column name."""
+    transformers = transformers or {}
+    geometry_dicts: dict[str, list[dict | None]] = {}
+    for column in geometry_columns:
+        geoms = _batch_to_geometries(
+            chunk,
+            column,
+            simplify_tolerance,
+            coordinate_precision,
+            transformers.get(column),
+        )
+        geometry_dicts[column] = [
+            None if geometry_json is None else json_backend.loads(geometry_json)
+            for geometry_json in shapely.to_geojson(geoms)
+        ]
+    return geometry_dicts
+
+
+def _batch_to_features(
+    chunk: pyarrow.RecordBatch,
+    primary_column: str,
+    simplify_tolerance: Optional[float] = None,
+    coordinate_precision: Optional[int] = None,
+    transformers: Optional[dict[str, pyproj.Transformer]] = None,
+    geometry_columns: Optional[list[str]] = None,
+) -> list[Feature]:
+    transformers = transformers or {}
+    geoms = _batch_to_geometries(
+        chunk,
+        primary_column,
+        simplify_tolerance,
+        coordinate_precision,
+        transformers.get(primary_column),
+    )
+    geometry_dicts = _batch_to_geometry_dicts(
+        chunk,
+        geometry_columns or [],
+        simplify_tolerance,
+        coordinate_precision,
+        transformers,
+    )
+    return list(
+        map(
+            _shapely_to_feature,
+            geoms,
+            shapely.to_geojson(geoms),
+            shapely.bounds(geoms).tolist(),
+            _batch_to_records(chunk, primary_column, geometry_dicts),
+        )
+    )
+
+
+def _batch_to_geojson_strings(
+    chunk: pyarrow.RecordBatch,
+    primary_column: str,
+    simplify_tolerance: Optional[float] = None,
+    coordinate_precision: Optional[int] = None,
+    transformers: Optional[dict[str, pyproj.Transformer]] = None,
+    geometry_columns: Optional[list[str]] = None,
+) -> list[str]:
+    """Serializes a record batch to GeoJSON Feature strings, without pydantic models."""
+    transformers = transformers or {}
+    geoms = _batch_to_geometries(
+        chunk,
+        primary_column,
+        simplify_tolerance,
+        coordinate_precision,
+        transformers.get(primary_column),
+    )
+    geometry_dicts = _batch_to_geometry_dicts(
+        chunk,
+        geometry_columns or [],
+        simplify_tolerance,
+        coordinate_precision,
+        transformers,
+    )
+    return [
+        f'{{"type":"Feature","geometry":{geometry_json or "null"},'
+        f'"properties":{json_backend.dumps(properties)}'
+        + ("" if np.isnan(bounds[0]) else f',"bbox":{json_backend.dumps(bounds)}')
+        + "}"
+        for geometry_json, bounds, properties in zip(
+            shapely.to_geojson(geoms),
+            shapely.bounds(geoms).tolist(),
+            _batch_to_records(chunk, primary_column, geometry_dicts),
+        )
+    ]
+
+
+def _get_parquet_file(
+    geoparquet_file: str | Path | pyarrow.parquet.ParquetFile,
+    read_file_kwargs: Optional[dict] = None,
+) -> pyarrow.parquet.ParquetFile:
+    """Opens a parquet file, memory mapped unless param:read_file_kwargs says otherwise."""
+    default_read_file_kwargs = {
+        "memory_map": True,
+    }
+    if read_file_kwargs is None:
+        read_file_kwargs = default_read_file_kwargs
+    elif isinstance(read_file_kwargs, dict):
+        read_file_kwargs = {**default_read_file_kwargs, **read_file_kwargs}
+    else:
+        raise TypeError(f"Optional param:read_file_kwargs must be a dict or None!")
+
+    if isinstance(geoparquet_file, (str, Path)):
+        geoparquet_file = pyarrow.parquet.ParquetFile(
+            geoparquet_file,
+            **read_file_kwargs,
+        )
+    if not isinstance(geoparquet_file, pyarrow.parquet.ParquetFile):
+        raise TypeError(
+            "Input must be a file path (str | Path) or a ParquetFile object!"
+        )
+    return geoparquet_file
+
+
+def _iter_row_groups(
+    parquet_file: pyarrow.parquet.ParquetFile,
+    columns: Optional[list[str]] = None,
+) -> Iterator[pyarrow.RecordBatch]:
+    """Lazily reads a parquet file one row group at a time, so that only one row
+    group is decompressed in memory at once."""
+    for i in range(parquet_file.num_row_groups):
+        yield from parquet_file.read_row_group(i, columns=columns).to_batches()
+
+
+def _get_geoparquet_stream(
+    geoparquet: (
+        pyarrow.Table | pyarrow.RecordBatchReader | ArrowStreamExportable | str | Path
+    ),
+    primary_column: str,
+) -> tuple[pyarrow.Schema, Iterable[pyarrow.RecordBatch]]:
+    """Gets the schema and a lazy record batch iterable of a GeoParquet input, without
+    its covering (i.e., bbox) columns."""
+    is_path = isinstance(geoparquet, (str, Path))
+    if is_path and Path(geoparquet).is_dir():
+        # prefer the dataset-level metadata of a _metadata sidecar if present
+        metadata_path = Path(geoparquet) / "_metadata"
+        if metadata_path.exists():
+            dataset = pyarrow.dataset.parquet_dataset(metadata_path)
+        else:
+            dataset = pyarrow.dataset.dataset(geoparquet, format="parquet")
+        schema = dataset.schema
+    elif is_path:
+        parquet_file = _get_parquet_file(geoparquet)
+        schema = parquet_file.schema_arrow
+    else:
+        try:
+            schema, batches = _get_arrow_stream(geoparquet)
+        except ValueError:
+            raise ValueError(
+                "param:geoparquet must be a valid pyarrow.Table, RecordBatchReader, Arrow stream, or parquet file"
+            )
+
+    if primary_column not in schema.names:
+        raise ValueError(f"Primary column {primary_column} not found in the table.")
+
+    # covering columns are skipped when reading files, and dropped from streams
+    _, covering_columns = _get_geometry_columns(schema, primary_column)
+    columns = [name for name in schema.names if name not in covering_columns]
+    if is_path and Path(geoparquet).is_dir():
+        batches = dataset.to_batches(columns=columns)
+    elif is_path:
+        batches = _iter_row_groups(parquet_file, columns)
+    elif covering_columns:
+        batches = (batch.drop_columns(covering_columns) for batch in batches)
+    return schema, batches
+
+
+def iter_geojson_features(
+    geoparquet: (
+        pyarrow.Table | pyarrow.RecordBatchReader | ArrowStreamExportable | str | Path
+    ),
+    primary_column: Optional[str] = None,
+    max_chunksize: Optional[int] = None,
+    max_batch_bytes: Optional[int] = None,
+    simplify_tolerance: Optional[float] = None,
+    coordinate_precision: Optional[int] = None,
+    target_crs: Optional[str] = None,
+) -> Iterator[Feature]:
+    """Lazily converts GeoParquet data to GeoJSON Pydantic Features, one record batch
+    at a time.
+
+    Args:
+        geoparquet (pyarrow.Table | RecordBatchReader | ArrowStreamExportable | str | Path):
+            An Arrow.Table, RecordBatchReader, object implementing the Arrow PyCapsule
+            stream protocol (__arrow_c_stream__), or parquet file with GeoParquet metadata.
+            Parquet files are memory mapped and read lazily, one row group at a time.
+        primary_column (str, optional): The name of the primary column. Defaults to 'geometry'.
+        max_chunksize (int, optional): The maximum number of rows converted at a time.
+            Defaults to 1000, or no limit if param:max_batch_bytes is set.
+        max_batch_bytes (int, optional): The maximum number of primary column WKB bytes
+            converted at a time, to keep peak memory predictable for large geometries.
+            Defaults to None (batches are only sized by row count).
+        simplify_tolerance (float, optional): Simplify geometries with this distance
+            tolerance (in CRS units, topology preserving). Defaults to None (no simplification).
+        coordinate_precision (int, optional): Round coordinates to this many decimal
+            places. Defaults to None (full precision).
+        target_crs (str, optional): Reproject the geometries from each geometry column's
+            crs (in the geo metadata) to this CRS, before simplifying and rounding.
+            Defaults to None (no reprojection).
+
+    Yields:
+        Feature: GeoJSON Pydantic Features, in the row order of the input.
+    """
+    if not primary_column:
+        primary_column = "geometry"
+    if not max_chunksize and not max_batch_bytes:
+        max_chunksize = 1000
+
+    schema, batches = _get_geoparquet_stream(geoparquet, primary_column)
+    geometry_columns, _ = _get_geometry_columns(schema, primary_column)
+    transformers = _get_transformers(
+        schema,
+        [primary_column, *geometry_columns],
+        target_crs,
     )
+    for chunk in _slice_batches(
+        batches,
+        max_chunksize,
+        max_batch_bytes,
+        primary_column,
+    ):
+        yield from _batch_to_features(
+            chunk,
+            primary_column,
+            simplify_tolerance,
+            coordinate_precision,
+            transformers,
+            geometry_columns,
+        )
 
 
 def geoparquet_to_geojson(
-    geoparquet: pyarrow.Table | str | Path,
+    geoparquet: (
+        pyarrow.Table | pyarrow.RecordBatchReader | ArrowStreamExportable | str | Path
+    ),
     primary_column: Optional[str] = None,
     max_chunksize: Optional[int] = None,
     max_workers: Optional[int] = None,
+    max_batch_bytes: Optional[int] = None,
+    simplify_tolerance: Optional[float] = None,
+    coordinate_precision: Optional[int] = None,
+    target_crs: Optional[str] = None,
 ) -> FeatureCollection:
     """Converts an Arrow table with GeoParquet metadata to a GeoJSON Pydantic
     FeatureCollection.
 
     Args:
-        geoparquet (pyarrow.Table): Either an Arrow.Table or parquet with GeoParquet metadata.
+        geoparquet (pyarrow.Table | RecordBatchReader | ArrowStreamExportable | str | Path):
+            An Arrow.Table, RecordBatchReader, object implementing the Arrow PyCapsule
+            stream protocol (__arrow_c_stream__), or parquet file with GeoParquet metadata.
+            Parquet files are memory mapped and read lazily, one row group at a time.
+            Streams are consumed batch by batch without copying.
         primary_column (str, optional): The name of the primary column. Defaults to 'geometry'.
         max_chunksize (int, optional): The maximum chunksize to read from the parquet file. Defaults to 1000.
-        max_workers (int, optional): The maximum number of workers to use for parallel processing.
-            Defaults to 0 (runs sequentially). Use -1 for all available cores.
+        max_workers (int, optional): The maximum number of threads used to decode record
+            batches (and all of their geometry columns) in parallel, reading at most one
+            batch ahead per thread. Defaults to 0 (runs sequentially). Use -1 for all
+            available cores.
+        max_batch_bytes (int, optional): The maximum number of primary column WKB bytes
+            converted at a time, to keep peak memory predictable for large geometries.
+            If set, param:max_chunksize defaults to no limit. Defaults to None.
+        simplify_tolerance (float, optional): Simplify geometries with this distance
+            tolerance (in CRS units, topology preserving). Defaults to None (no simplification).
+        coordinate_precision (int, optional): Round coordinates to this many decimal
+            places. Defaults to None (full precision).
+        target_crs (str, optional): Reproject the geometries from each geometry column's
+            crs (in the geo metadata) to this CRS, before simplifying and rounding.
+            Defaults to None (no reprojection).
     Returns:
         FeatureCollection: The GeoJSON Pydantic FeatureCollection.
     """
     if not primary_column:
         primary_column = "geometry"
-    if not max_chunksize:
+    if not max_chunksize and not max_batch_bytes:
         max_chunksize = 1000
-    if isinstance(geoparquet, (str, Path)):
-        geoparquet = pyarrow.parquet.read_table(geoparquet)
-    if not isinstance(geoparquet, pyarrow.Table):
-        raise ValueError(
-            "param:geoparquet must be a valid pyarrow.Table or parquet file"
-        )
-
-    if primary_column not in geoparquet.column_names:
-        raise ValueError(f"Primary column {primary_column} not found in the table.")
+    schema, batches = _get_geoparquet_stream(geoparquet, primary_column)
+    geometry_columns, _ = _get_geometry_columns(schema, primary_column)
 
     # attempt to get the bbox from metadata
-    bbox: BBox | None = _find_bbox(geoparquet)
-
-    # TODO: parallelize this (optionally)
-    if max_workers:
-        raise NotImplementedError("Parallel processing not yet implemented.")
-
-    feature_lists: list[list[Feature]] = []
-    for chunk in geoparquet.to_batches(max_chunksize):
-        chunk_dict = chunk.to_pydict()
-        geoms: list[bytes] = chunk_dict.pop(primary_column)
-        properties: Iterable[list[tuple[str, Any]]] = map(
-            _get_prop_records,
-            chunk_dict.items(),
-        )
-        feature_props: Iterable[list[tuple[str, Any]]] = map(
-            lambda i: [p[i] for p in properties],
-            range(len(geoms)),
-        )
-        try:
-            chunk_features: Iterable[Feature] = list(
-                map(
-                    lambda gp: _shapely_to_feature(shapely.from_wkb(gp[0]), gp[1]),
-                    zip(geoms, feature_props),
-                )
-            )
-        except shapely.errors.GEOSException as e:
-            raise ValueError(
-                f"Error converting WKB to shapely geometry. Make sure the WKB is valid! Exception: {e}"
-            )
+    bbox: BBox | None = _find_bbox(schema, primary_column)
+    transformers = _get_transformers(
+        schema,
+        [primary_column, *geometry_columns],
+        target_crs,
+    )
+    if target_crs:
+        bbox = _transform_bbox(bbox, transformers[primary_column])
 
-        feature_lists.append(chunk_features)
-    features: list[Feature] = list(functools.reduce(lambda a, b: a + b, feature_lists))
+    batch_to_features = functools.partial(
+        _batch_to_features,
+        primary_column=primary_column,
+        simplify_tolerance=simplify_tolerance,
+        coordinate_precision=coordinate_precision,
+        transformers=transformers,
+        geometry_columns=geometry_columns,
+    )
+    chunks = _slice_batches(
+        batches,
+        max_chunksize,
+        max_batch_bytes,
+        primary_column,
+    )
+    features: list[Feature] = []
+    max_workers = _get_max_workers(max_workers)
+    if not max_workers:
+        for chunk_features in map(batch_to_features, chunks):
+            features.extend(chunk_features)
+    else:
+        # shapely releases the GIL while decoding, and batches are read as workers free up
+        for chunk_features in _map_in_order(batch_to_features, chunks, max_workers):
+            features.extend(chunk_features)
 
     return FeatureCollection(
         type="FeatureCollection",
         features=features,
         bbox=bbox,
     )
+
+
+def geoparquet_to_geojson_file(
+    geoparquet: (
+        pyarrow.Table | pyarrow.RecordBatchReader | ArrowStreamExportable | str | Path
+    ),
+    geojson_file: str | Path,
+    primary_column: Optional[str] = None,
+    max_chunksize: Optional[int] = None,
+    max_batch_bytes: Optional[int] = None,
+    simplify_tolerance: Optional[float] = None,
+    coordinate_precision: Optional[int] = None,
+    target_crs: Optional[str] = None,
+) -> Path:
+    """Streams GeoParquet data to a GeoJSON FeatureCollection file, one record batch at
+    a time.
+
+    Features are serialized directly from the vectorized shapely GeoJSON output, so no
+    pydantic models (nor the full FeatureCollection) are held in memory.
+
+    Args:
+        geoparquet (pyarrow.Table | RecordBatchReader | ArrowStreamExportable | str | Path):
+            An Arrow.Table, RecordBatchReader, object implementing the Arrow PyCapsule
+            stream protocol (__arrow_c_stream__), or parquet file with GeoParquet metadata.
+            Parquet files are memory mapped and read lazily, one row group at a time.
+        geojson_file (str | Path): The GeoJSON file to write.
+        primary_column (str, optional): The name of the primary column. Defaults to 'geometry'.
+        max_chunksize (int, optional): The maximum number of rows converted at a time.
+            Defaults to 1000, or no limit if param:max_batch_bytes is set.
+        max_batch_bytes (int, optional): The maximum number of primary column WKB bytes
+            converted at a time. Defaults to None.
+        simplify_tolerance (float, optional): Simplify geometries with this distance
+            tolerance (in CRS units, topology preserving). Defaults to None (no simplification).
+        coordinate_precision (int, optional): Round coordinates to this many decimal
+            places. Defaults to None (full precision).
+        target_crs (str, optional): Reproject the geometries from each geometry column's
+            crs (in the geo metadata) to this CRS, before simplifying and rounding.
+            Defaults to None (no reprojection).
+
+    Returns:
+        Path: The path of the written GeoJSON file.
+    """
+    if not primary_column:
+        primary_column = "geometry"
+    if not max_chunksize and not max_batch_bytes:
+        max_chunksize = 1000
+    schema, batches = _get_geoparquet_stream(geoparquet, primary_column)
+    geometry_columns, _ = _get_geometry_columns(schema, primary_column)
+    bbox: BBox | None = _find_bbox(schema, primary_column)
+    transformers = _get_transformers(
+        schema,
+        [primary_column, *geometry_columns],
+        target_crs,
+    )
+    if target_crs:
+        bbox = _transform_bbox(bbox, transformers[primary_column])
+
+    geojson_file = Path(geojson_file)
+    with geojson_file.open("w") as f:
+        f.write('{"type":"FeatureCollection",')
+        if bbox:
+            f.write(f'"bbox":{json_backend.dumps(list(bbox))},')
+        f.write('"features":[')
+        separator = ""
+        for chunk in _slice_batches(
+            batches,
+            max_chunksize,
+            max_batch_bytes,
+            primary_column,
+        ):
+            features = _batch_to_geojson_strings(
+                chunk,
+                primary_column,
+                simplify_tolerance,
+                coordinate_precision,
+                transformers,
+                geometry_columns,
+            )
+            if features:
+                f.write(separator + ",".join(features))
+                separator = ","
+        f.write("]}")
+    return geojson_file
+
+
+class GeoParquetConverter:
+    """A reusable GeoJSON <> GeoParquet converter for many calls with the same schema.
+
+    The column schema, GeoParquet metadata (including the CRS parse) and its encoded
+    JSON are validated and computed once, so repeated conversions of small payloads
+    only pay for the features themselves. This fast path needs complete metadata: if a
+    geometry column's geometry_types are empty or its bbox is missing (as in the
+    default metadata), each call computes them and re-encodes the metadata JSON.
+
+    Args:
+        primary_column (str, optional): The name of the primary column. Defaults to 'geometry'.
+        column_schema (pyarrow.Schema, optional): The Arrow schema for the table. Defaults to None.
+        add_none_values (bool, default=False): Whether to fill missing column values
+            specified in param:column_schema with 'None' (converts to pyarrow.null()).
+        geo_metadata (GeoParquet | dict | None, optional): The GeoParquet metadata.
+            Defaults to WKB metadata with any geometry types allowed. Secondary geometry
+            columns are converted to and from GeoJSON geometry feature properties.
+
+    Example:
+        converter = GeoParquetConverter(column_schema=schema, geo_metadata=metadata)
+        table = converter.to_table(feature_collection)
+        feature_collection = converter.to_geojson(table)
+    """
+
+    def __init__(
+        self,
+        primary_column: Optional[str] = None,
+        column_schema: Optional[pyarrow.Schema] = None,
+        add_none_values: Optional[bool] = False,
+        geo_metadata: GeoParquetMetadata | dict | None = None,
+    ) -> None:
+        if not primary_column:
+            primary_column = "geometry"
+        if not geo_metadata:
+            geo_metadata = GeoParquetMetadata(
+                primary_column=primary_column,
+                columns={
+                    primary_column: GeometryColumnMetadata(
+                        encoding="WKB",
+                        geometry_types=[],
+                    ),
+                },
+            )
+        if isinstance(geo_metadata, dict):
+            geo_metadata = GeoParquetMetadata(**geo_metadata)
+        if not isinstance(geo_metadata, GeoParquetMetadata):
+            raise ValueError(
+                "geo_metadata must be a valid GeoParquet class, dict, or None"
+            )
+
+        self.primary_column: str = primary_column
+        self.add_none_values: bool = bool(add_none_values)
+        self.geo_metadata: GeoParquetMetadata = geo_metadata
+        self.geometry_columns: list[str] = _get_secondary_columns(
+            geo_metadata,
+            primary_column,
+        )
+        self._geo_metadata_dict: dict[str, Any] = geo_metadata.model_dump()
+        self.column_schema: pyarrow.Schema = _get_column_schema(
+            column_schema,
+            primary_column,
+            self.geometry_columns,
+        ).with_metadata(_encode_metadata({"geo": self._geo_metadata_dict}))
+        self.bbox: BBox | None = _find_bbox(self.column_schema, primary_column)
+
+    def to_table(self, geojson: FeatureCollection | list[Feature]) -> pyarrow.Table:
+        """Converts GeoJSON Pydantic features to an Arrow table with geoparquet metadata.
+
+        Geometry column bboxes and types missing from the converter's metadata are
+        computed from the features.
+
+        Args:
+            geojson (FeatureCollection | list[Feature]): The features to convert.
+
+        Returns:
+            The Arrow table with GeoParquet metadata.
+        """
+        if isinstance(geojson, FeatureCollection):
+            geojson = geojson.features
+        columns, geometries = _features_to_columns(
+            geojson,
+            self.column_schema,
+            self.primary_column,
+            self.add_none_values,
+            geometry_columns=self.geometry_columns,
+        )
+        schema = self.column_schema
+        geo_metadata = _fill_geo_metadata(self._geo_metadata_dict, geometries)
+        if geo_metadata is not self._geo_metadata_dict:
+            schema = schema.with_metadata(_encode_metadata({"geo": geo_metadata}))
+        return pyarrow.Table.from_pydict(columns, schema=schema)
+
+    def to_geojson(
+        self,
+        geoparquet: pyarrow.Table | pyarrow.RecordBatchReader | ArrowStreamExportable,
+        simplify_tolerance: Optional[float] = None,
+        coordinate_precision: Optional[int] = None,
+    ) -> FeatureCollection:
+        """Converts GeoParquet data to a GeoJSON Pydantic FeatureCollection.
+
+        The FeatureCollection bbox is taken from the GeoParquet metadata of the data if
+        present, otherwise from the converter's.
+
+        Args:
+            geoparquet (pyarrow.Table | RecordBatchReader | ArrowStreamExportable): The
+                Arrow data to convert.
+            simplify_tolerance (float, optional): Simplify geometries with this distance
+                tolerance (in CRS units). Defaults to None (no simplification).
+            coordinate_precision (int, optional): Round coordinates to this many decimal
+                places. Defaults to None (full precision).
+
+        Returns:
+            FeatureCollection: The GeoJSON Pydantic FeatureCollection.
+        """
+        schema, batches = _get_geoparquet_stream(geoparquet, self.primary_column)
+        geometry_columns = [
+            name for name in self.geometry_columns if name in schema.names
+        ]
+        bbox = self.bbox
+        if schema.metadata and b"geo" in schema.metadata:
+            bbox = _find_bbox(schema, self.primary_column)
+        features: list[Feature] = []
+        for batch in batches:
+            features.extend(
+                _batch_to_features(
+                    batch,
+                    self.primary_column,
+                    simplify_tolerance,
+                    coordinate_precision,
+                    geometry_columns=geometry_columns,
+                )
+            )
+        return FeatureCollection(
+            type="FeatureCollection",
+            features=features,
+            bbox=bbox,
+        )
@@ -0,0 +1,220 @@
+"""For incrementally appending features to a multi-file GeoParquet dataset.
+
+Each append writes the new features as an additional parquet file, and merges its
+geometry types and bbox into the dataset-level `_metadata` sidecar file. Existing
+data files are never read or rewritten.
+
+The sidecar is read, merged and replaced without a lock, so only one writer may
+append to a dataset at a time (concurrent appends lose each other's row groups).
+"""
+
+import os
+import uuid
+import pyarrow
+import pyarrow.parquet
+from geojson_pydantic.features import FeatureCollection
+from geoparquet_pydantic.schemas import (
+    GeometryColumnMetadata,
+    GeoParquetMetadata,
+)
+from geoparquet_pydantic.convert import (
+    _decode_geo_metadata,
+    _encode_metadata,
+    geojson_to_geoparquet,
+)
+from pathlib import Path
+from typing import Optional
+
+METADATA_FILE_NAME = "_metadata"
+
+# the geometry column metadata merged across files, every other field must match
+_MERGEABLE_FIELDS = ("geometry_types", "bbox")
+
+
+def _merge_bbox(
+    bbox: list[float] | None,
+    other_bbox: list[float] | None,
+) -> list[float] | None:
+    if not bbox or not other_bbox:
+        return bbox or other_bbox
+    return [
+        min(bbox[0], other_bbox[0]),
+        min(bbox[1], other_bbox[1]),
+        max(bbox[2], other_bbox[2]),
+        max(bbox[3], other_bbox[3]),
+    ]
+
+
+def _merge_geo_metadata(
+    geo_metadata: GeoParquetMetadata,
+    other_geo_metadata: GeoParquetMetadata,
+) -> GeoParquetMetadata:
+    """Merges the geometry types and bbox of each geometry column.
+
+    Raises a ValueError if the primary column, the geometry columns, or any other
+    column metadata (i.e., crs, edges or encoding) differ, since the merged bbox and
+    types would be wrong for some of the files.
+    """
+    if geo_metadata.primary_column != other_geo_metadata.primary_column:
+        raise ValueError(
+            f"primary_column={other_geo_metadata.primary_column} does not match the dataset primary_column={geo_metadata.primary_column}"
+        )
+    if geo_metadata.columns.keys() != other_geo_metadata.columns.keys():
+        raise ValueError(
+            f"Geometry columns={list(other_geo_metadata.columns.keys())} do not match the dataset geometry columns={list(geo_metadata.columns.keys())}"
+        )
+    columns = dict(geo_metadata.columns)
+    for name, other_column in other_geo_metadata.columns.items():
+        column = columns[name]
+        if not isinstance(column, GeometryColumnMetadata) or not isinstance(
+            other_column, GeometryColumnMetadata
+        ):
+            continue
+        values = column.model_dump(exclude=set(_MERGEABLE_FIELDS))
+        other_values = other_column.model_dump(exclude=set(_MERGEABLE_FIELDS))
+        for field in sorted(values.keys() | other_values.keys()):
+            if values.get(field) != other_values.get(field):
+                raise ValueError(
+                    f"Column={name} {field}={other_values.get(field)} does not match the dataset {field}={values.get(field)}"
+                )
+        # an empty list means any geometry type
+        geometry_types = []
+        if column.geometry_types and other_column.geometry_types:
+            geometry_types = list(column.geometry_types) + [
+                t for t in other_column.geometry_types if t not in column.geometry_types
+            ]
+        columns[name] = column.model_copy(
+            update={
+                "geometry_types": geometry_types,
+                "bbox": _merge_bbox(column.bbox, other_column.bbox),
+            }
+        )
+    return geo_metadata.model_copy(update={"columns": columns})
+
+
+def _read_dataset_metadata(dataset_dir: Path) -> list[pyarrow.parquet.FileMetaData]:
+    """Reads the `_metadata` sidecar, or the footers of existing data files without one.
+
+    The footers are returned with their file paths set relative to the dataset
+    directory, so the first append into a directory of plain parquet files indexes
+    them in the new sidecar too. Files pyarrow skips during discovery (i.e., those
+    starting with "_" or ".") are skipped as well.
+    """
+    metadata_path = dataset_dir / METADATA_FILE_NAME
+    if metadata_path.exists():
+        return [pyarrow.parquet.read_metadata(metadata_path)]
+    footers = []
+    for path in sorted(dataset_dir.rglob("*.parquet")):
+        relative_path = path.relative_to(dataset_dir)
+        if any(part.startswith(("_", ".")) for part in relative_path.parts):
+            continue
+        metadata = pyarrow.parquet.read_metadata(path)
+        metadata.set_file_path(relative_path.as_posix())
+        footers.append(metadata)
+    return footers
+
+
+def append_to_geoparquet_dataset(
+    geojson: FeatureCollection | Path,
+    dataset_dir: str | Path,
+    primary_column: Optional[str] = None,
+    column_schema: Optional[pyarrow.Schema] = None,
+    add_none_values: Optional[bool] = False,
+    geo_metadata: GeoParquetMetadata | dict | None = None,
+    write_table_kwargs: Optional[dict] = None,
+) -> Path:
+    """Appends GeoJSON Pydantic features to a GeoParquet dataset directory as a new file.
+
+    The new file's geometry types and bbox are merged into the dataset-level geo
+    metadata stored in the `_metadata` sidecar file, which also indexes the row groups
+    of every file. Existing data files are left untouched. If the directory already
+    holds parquet files but no sidecar, the sidecar is built from their footers. The
+    rest of the geo metadata (i.e., crs, edges and encoding) must match the dataset's.
+
+    Appends are not locked, so only one writer may append to a dataset at a time.
+
+    The dataset can be read with pyarrow.dataset.parquet_dataset(dataset_dir / "_metadata"),
+    or pyarrow.parquet.read_table(dataset_dir).
+
+    Args:
+        geojson (FeatureCollection | Path): The GeoJSON Pydantic FeatureCollection to append.
+        dataset_dir (str | Path): The dataset directory. Created if it does not exist.
+        primary_column (str, optional): The name of the primary column. Defaults to None.
+        column_schema (pyarrow.Schema, optional): The Arrow schema for the table. Must
+            match the existing dataset schema. Defaults to None.
+        add_none_values (bool, default=False): Whether to fill missing column values
+            specified in param:column_schema with 'None' (converts to pyarrow.null()).
+        geo_metadata (GeoParquet | dict | None, optional): The GeoParquet metadata.
+        write_table_kwargs (dict, optional): Kwargs to be passed into pyarrow.parquet.write_table().
+
+    Returns:
+        Path: The path of the newly written parquet file.
+    """
+    if write_table_kwargs is None:
+        write_table_kwargs = {}
+    elif not isinstance(write_table_kwargs, dict):
+        raise TypeError(f"Optional param:write_table_kwargs must be a dict or None!")
+
+    table = geojson_to_geoparquet(
+        geojson,
+        primary_column=primary_column,
+        column_schema=column_schema,
+        add_none_values=add_none_values,
+        geo_metadata=geo_metadata,
+    )
+
+    file_geo_metadata = GeoParquetMetadata(
+        **_decode_geo_metadata(table.schema.metadata),
+    )
+
+    dataset_dir = Path(dataset_dir)
+    dataset_dir.mkdir(parents=True, exist_ok=True)
+    metadata_path = dataset_dir / METADATA_FILE_NAME
+    metadata_collector: list[pyarrow.parquet.FileMetaData] = []
+    dataset_geo_metadata = None
+    for dataset_metadata in _read_dataset_metadata(dataset_dir):
+        dataset_schema = dataset_metadata.schema.to_arrow_schema()
+        if not dataset_schema.remove_metadata().equals(table.schema.remove_metadata()):
+            raise ValueError(
+                f"The new features schema does not match the dataset schema: {dataset_schema}"
+            )
+        if not dataset_schema.metadata or b"geo" not in dataset_schema.metadata:
+            raise ValueError("No GeoParquet metadata found in the dataset schema.")
+        file_dataset_geo_metadata = GeoParquetMetadata(
+            **_decode_geo_metadata(dataset_schema.metadata),
+        )
+        if dataset_geo_metadata is None:
+            dataset_geo_metadata = file_dataset_geo_metadata
+        else:
+            dataset_geo_metadata = _merge_geo_metadata(
+                dataset_geo_metadata, file_dataset_geo_metadata
+            )
+        metadata_collector.append(dataset_metadata)
+    if dataset_geo_metadata is None:
+        dataset_geo_metadata = file_geo_metadata
+    else:
+        dataset_geo_metadata = _merge_geo_metadata(
+            dataset_geo_metadata, file_geo_metadata
+        )
+
+    # write the new features as their own file
+    file_name = f"part-{uuid.uuid4().hex}.parquet"
+    pyarrow.parquet.write_table(
+        table,
+        dataset_dir / file_name,
+        metadata_collector=metadata_collector,
+        **write_table_kwargs,
+    )
+    metadata_collector[-1].set_file_path(file_name)
+
+    # atomically replace the sidecar with the merged metadata
+    temp_metadata_path = dataset_dir / f"{METADATA_FILE_NAME}.{uuid.uuid4().hex}"
+    pyarrow.parquet.write_metadata(
+        table.schema.with_metadata(
+            _encode_metadata({"geo": dataset_geo_metadata.model_dump()}),
+        ),
+        temp_metadata_path,
+        metadata_collector=metadata_collector,
+    )
+    os.replace(temp_metadata_path, metadata_path)
+    return dataset_dir / file_name
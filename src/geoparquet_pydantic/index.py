@@ -0,0 +1,395 @@
+"""A packed Hilbert R-tree spatial index sidecar for GeoParquet files.
+
+The index stores the bounds of every row's primary geometry, sorted along a Hilbert
+curve and packed bottom-up into a static R-tree (like flatbush). It is written as flat
+arrays next to the GeoParquet file (i.e., `data.parquet.rtree`) so it can be memory
+mapped, and records the parquet file's size and mtime to detect when it is stale.
+
+Layout (little endian): a 64 byte header, then
+    boxes: float64[num_nodes, 4] (xmin, ymin, xmax, ymax), leaves first and root last
+    indices: uint64[num_nodes], the row number of leaves or first child of other nodes
+    row_group_offsets: uint64[num_row_groups + 1], the first row number of each row group
+"""
+
+import os
+import struct
+import uuid
+import numpy as np
+import pyarrow
+import pyarrow.parquet
+import shapely
+from geoparquet_pydantic.convert import _decode_geo_metadata
+from pathlib import Path
+from typing import Optional
+
+INDEX_SUFFIX = ".rtree"
+_MAGIC = b"GPQRTREE"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQQq")
+_HEADER_SIZE = 64
+_HILBERT_MAX = (1 << 16) - 1
+
+
+def _hilbert(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Vectorized Hilbert curve index of 16 bit (x, y) coordinates.
+
+    See: https://github.com/rawrunprotected/hilbert_curves (public domain)
+    """
+    x = x.astype(np.uint32)
+    y = y.astype(np.uint32)
+    a = x ^ y
+    b = 0xFFFF ^ a
+    c = 0xFFFF ^ (x | y)
+    d = x & (y ^ 0xFFFF)
+
+    A = a | (b >> 1)
+    B = (a >> 1) ^ a
+    C = ((c >> 1) ^ (b & (d >> 1))) ^ c
+    D = ((a & (c >> 1)) ^ (d >> 1)) ^ d
+
+    for shift in (2, 4):
+        a, b, c, d = A, B, C, D
+        A = (a & (a >> shift)) ^ (b & (b >> shift))
+        B = (a & (b >> shift)) ^ (b & ((a ^ b) >> shift))
+        C = C ^ ((a & (c >> shift)) ^ (b & (d >> shift)))
+        D = D ^ ((b & (c >> shift)) ^ ((a ^ b) & (d >> shift)))
+
+    a, b, c, d = A, B, C, D
+    C = C ^ ((a & (c >> 8)) ^ (b & (d >> 8)))
+    D = D ^ ((b & (c >> 8)) ^ ((a ^ b) & (d >> 8)))
+
+    a = C ^ (C >> 1)
+    b = D ^ (D >> 1)
+    i0 = x ^ y
+    i1 = b | (0xFFFF ^ (i0 | a))
+
+    def _interleave(i: np.ndarray) -> np.ndarray:
+        i = (i | (i << 8)) & 0x00FF00FF
+        i = (i | (i << 4)) & 0x0F0F0F0F
+        i = (i | (i << 2)) & 0x33333333
+        return (i | (i << 1)) & 0x55555555
+
+    return (_interleave(i1) << 1) | _interleave(i0)
+
+
+def _hilbert_order(bounds: np.ndarray) -> np.ndarray:
+    """Gets the order of (non-NaN) bounds along a hilbert curve of their centers."""
+    extent_min = bounds[:, :2].min(axis=0)
+    extent_size = bounds[:, 2:].max(axis=0) - extent_min
+    extent_size[extent_size == 0] = 1
+    centers = (bounds[:, :2] + bounds[:, 2:]) / 2
+    scaled = np.floor(_HILBERT_MAX * (centers - extent_min) / extent_size)
+    return np.argsort(_hilbert(scaled[:, 0], scaled[:, 1]), kind="stable")
+
+
+def _get_level_ends(num_items: int, node_size: int) -> list[int]:
+    """Gets the end position of each tree level, from the leaves up to the root."""
+    level_ends = [num_items]
+    count = num_items
+    while True:
+        count = -(-count // node_size)
+        level_ends.append(level_ends[-1] + count)
+        if count <= 1:
+            return level_ends
+
+
+def _concat_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Vectorized concatenation of [start, end) integer ranges."""
+    lengths = ends - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+
+def _get_index_path(
+    geoparquet_file: str | Path,
+    index_path: Optional[str | Path] = None,
+) -> Path:
+    if index_path:
+        return Path(index_path)
+    return Path(str(geoparquet_file) + INDEX_SUFFIX)
+
+
+class SpatialIndex:
+    """A static packed Hilbert R-tree of the row bounds of a GeoParquet file.
+
+    Use build_spatial_index() to create one, and load_spatial_index() to open it.
+    """
+
+    def __init__(
+        self,
+        geoparquet_file: str | Path,
+        boxes: np.ndarray,
+        indices: np.ndarray,
+        row_group_offsets: np.ndarray,
+        node_size: int,
+        num_items: int,
+        file_size: int,
+        file_mtime_ns: int,
+    ) -> None:
+        self.geoparquet_file = Path(geoparquet_file)
+        self.boxes = boxes
+        self.indices = indices
+        self.row_group_offsets = row_group_offsets
+        self.node_size = node_size
+        self.num_items = num_items
+        self.file_size = file_size
+        self.file_mtime_ns = file_mtime_ns
+        self._level_ends = _get_level_ends(num_items, node_size)
+        self._parquet_file: pyarrow.parquet.ParquetFile | None = None
+
+    def is_stale(self) -> bool:
+        """Whether the GeoParquet file changed (size or mtime) since the index was built."""
+        try:
+            stat = os.stat(self.geoparquet_file)
+        except FileNotFoundError:
+            return True
+        return stat.st_size != self.file_size or stat.st_mtime_ns != self.file_mtime_ns
+
+    def query(
+        self, bbox: list[float] | tuple[float, float, float, float]
+    ) -> np.ndarray:
+        """Gets the sorted row numbers whose geometry bounds intersect a bbox.
+
+        Args:
+            bbox (list[float]): The [xmin, ymin, xmax, ymax] query box.
+
+        Returns:
+            np.ndarray: The matching row numbers of the GeoParquet file.
+        """
+        xmin, ymin, xmax, ymax = bbox
+        if not len(self.boxes):
+            return np.array([], dtype=np.uint64)
+
+        def _intersects(nodes: np.ndarray) -> np.ndarray:
+            boxes = self.boxes[nodes]
+            return nodes[
+                (boxes[:, 0] <= xmax)
+                & (boxes[:, 1] <= ymax)
+                & (boxes[:, 2] >= xmin)
+                & (boxes[:, 3] >= ymin)
+            ]
+
+        # walk down the tree one level at a time, keeping intersecting nodes
+        nodes = _intersects(np.array([len(self.boxes) - 1]))
+        for level in range(len(self._level_ends) - 1, 0, -1):
+            starts = self.indices[nodes].astype(np.int64)
+            ends = np.minimum(starts + self.node_size, self._level_ends[level - 1])
+            nodes = _intersects(_concat_ranges(starts, ends))
+        return np.sort(self.indices[nodes])
+
+    def read(
+        self,
+        bbox: list[float] | tuple[float, float, float, float],
+        columns: Optional[list[str]] = None,
+    ) -> pyarrow.Table:
+        """Reads the rows whose geometry bounds intersect a bbox.
+
+        Only the row groups containing matches are read from the (memory mapped) file.
+
+        Args:
+            bbox (list[float]): The [xmin, ymin, xmax, ymax] query box.
+            columns (list[str], optional): The columns to read. Defaults to all columns.
+
+        Returns:
+            pyarrow.Table: The matching rows, with the file's GeoParquet metadata.
+        """
+        if self.is_stale():
+            raise ValueError(
+                f"The spatial index of {self.geoparquet_file} is stale, reload it."
+            )
+        if self._parquet_file is None:
+            self._parquet_file = pyarrow.parquet.ParquetFile(
+                self.geoparquet_file,
+                memory_map=True,
+            )
+        rows = self.query(bbox).astype(np.int64)
+        row_groups = np.searchsorted(self.row_group_offsets, rows, side="right") - 1
+        unique_row_groups = np.unique(row_groups)
+        if not len(unique_row_groups):
+            return self._parquet_file.schema_arrow.empty_table().select(
+                columns or self._parquet_file.schema_arrow.names
+            )
+
+        # map file row numbers to row numbers of the concatenated row groups read
+        row_group_sizes = np.diff(self.row_group_offsets.astype(np.int64))
+        read_offsets = np.cumsum(row_group_sizes[unique_row_groups])
+        read_offsets -= row_group_sizes[unique_row_groups]
+        local_rows = (
+            rows
+            - self.row_group_offsets.astype(np.int64)[row_groups]
+            + read_offsets[np.searchsorted(unique_row_groups, row_groups)]
+        )
+        table = self._parquet_file.read_row_groups(
+            unique_row_groups.tolist(),
+            columns=columns,
+        )
+        return table.take(local_rows)
+
+
+def build_spatial_index(
+    geoparquet_file: str | Path,
+    index_path: Optional[str | Path] = None,
+    primary_column: Optional[str] = None,
+    node_size: int = 16,
+) -> Path:
+    """Builds a packed Hilbert R-tree index of a GeoParquet file's row bounds.
+
+    The primary geometry column is read one row group at a time.
+
+    Args:
+        geoparquet_file (str | Path): The GeoParquet file to index.
+        index_path (str | Path, optional): Where to write the index. Defaults to the
+            GeoParquet file path with a '.rtree' suffix added.
+        primary_column (str, optional): The geometry column to index. Defaults to the
+            primary column of the GeoParquet metadata.
+        node_size (int, default=16): The maximum number of children per tree node.
+
+    Returns:
+        Path: The path of the written index.
+    """
+    if node_size < 2:
+        raise ValueError("param:node_size must be at least 2")
+    index_path = _get_index_path(geoparquet_file, index_path)
+    stat = os.stat(geoparquet_file)
+    parquet_file = pyarrow.parquet.ParquetFile(geoparquet_file, memory_map=True)
+    if not primary_column:
+        primary_column = _decode_geo_metadata(
+            parquet_file.schema_arrow.metadata or {},
+        )["primary_column"]
+
+    # get the bounds of every row, one row group at a time
+    bounds_list = []
+    for i in range(parquet_file.num_row_groups):
+        column = parquet_file.read_row_group(i, columns=[primary_column]).column(0)
+        bounds_list.append(
+            shapely.bounds(shapely.from_wkb(column.to_numpy(zero_copy_only=False)))
+        )
+    row_group_offsets = np.zeros(parquet_file.num_row_groups + 1, dtype=np.uint64)
+    row_group_offsets[1:] = np.cumsum([len(b) for b in bounds_list])
+    bounds = np.concatenate(bounds_list) if bounds_list else np.empty((0, 4))
+
+    # null and empty geometries can not match a query, so are not indexed
+    rows = np.flatnonzero(~np.isnan(bounds).any(axis=1)).astype(np.uint64)
+    bounds = bounds[rows]
+    num_items = len(rows)
+
+    if num_items:
+        order = _hilbert_order(bounds)
+
+        # pack the tree bottom up, each parent covering node_size children
+        level_ends = _get_level_ends(num_items, node_size)
+        boxes = np.empty((level_ends[-1], 4), dtype=np.float64)
+        indices = np.empty(level_ends[-1], dtype=np.uint64)
+        boxes[:num_items] = bounds[order]
+        indices[:num_items] = rows[order]
+        for level_start, level_end, parent_end in zip(
+            [0] + level_ends[:-2],
+            level_ends[:-1],
+            level_ends[1:],
+        ):
+            starts = np.arange(level_start, level_end, node_size)
+            children = boxes[level_start:level_end]
+            parent_start = level_end
+            boxes[parent_start:parent_end, :2] = np.minimum.reduceat(
+                children[:, :2], starts - level_start
+            )
+            boxes[parent_start:parent_end, 2:] = np.maximum.reduceat(
+                children[:, 2:], starts - level_start
+            )
+            indices[parent_start:parent_end] = starts
+    else:
+        boxes = np.empty((0, 4), dtype=np.float64)
+        indices = np.empty(0, dtype=np.uint64)
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        node_size,
+        num_items,
+        len(boxes),
+        len(row_group_offsets),
+        stat.st_size,
+        stat.st_mtime_ns,
+    ).ljust(_HEADER_SIZE, b"\0")
+
+    # write to a temporary file first so readers never see a partial index
+    temp_path = index_path.with_name(f"{index_path.name}.{uuid.uuid4().hex}")
+    with open(temp_path, "wb") as f:
+        f.write(header)
+        f.write(boxes.astype("<f8").tobytes())
+        f.write(indices.astype("<u8").tobytes())
+        f.write(row_group_offsets.astype("<u8").tobytes())
+    os.replace(temp_path, index_path)
+    return index_path
+
+
+def load_spatial_index(
+    geoparquet_file: str | Path,
+    index_path: Optional[str | Path] = None,
+    primary_column: Optional[str] = None,
+    rebuild: bool = True,
+) -> SpatialIndex:
+    """Memory maps the spatial index of a GeoParquet file.
+
+    Args:
+        geoparquet_file (str | Path): The indexed GeoParquet file.
+        index_path (str | Path, optional): The index path. Defaults to the GeoParquet file
+            path with a '.rtree' suffix added.
+        primary_column (str, optional): The geometry column to index if (re)building.
+            Defaults to the primary column of the GeoParquet metadata.
+        rebuild (bool, default=True): Whether to (re)build the index if it is missing or
+            stale (the GeoParquet file size or mtime changed). Otherwise raises a ValueError.
+
+    Returns:
+        SpatialIndex: The memory mapped spatial index.
+    """
+    index_path = _get_index_path(geoparquet_file, index_path)
+    if not index_path.exists():
+        if not rebuild:
+            raise ValueError(f"No spatial index found at {index_path}")
+        build_spatial_index(geoparquet_file, index_path, primary_column)
+
+    with open(index_path, "rb") as f:
+        header = f.read(_HEADER_SIZE)
+    (
+        magic,
+        version,
+        node_size,
+        num_items,
+        num_nodes,
+        num_offsets,
+        file_size,
+        file_mtime_ns,
+    ) = _HEADER.unpack(header[: _HEADER.size])
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"Invalid spatial index file: {index_path}")
+
+    def _memmap(dtype: str, offset: int, shape: tuple[int, ...]) -> np.ndarray:
+        if not np.prod(shape):
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(index_path, dtype=dtype, mode="r", offset=offset, shape=shape)
+
+    boxes_offset = _HEADER_SIZE
+    indices_offset = boxes_offset + num_nodes * 4 * 8
+    offsets_offset = indices_offset + num_nodes * 8
+    index = SpatialIndex(
+        geoparquet_file,
+        boxes=_memmap("<f8", boxes_offset, (num_nodes, 4)),
+        indices=_memmap("<u8", indices_offset, (num_nodes,)),
+        row_group_offsets=_memmap("<u8", offsets_offset, (num_offsets,)),
+        node_size=node_size,
+        num_items=num_items,
+        file_size=file_size,
+        file_mtime_ns=file_mtime_ns,
+    )
+    if index.is_stale():
+        if not rebuild:
+            raise ValueError(f"Spatial index {index_path} is stale, rebuild it.")
+        build_spatial_index(
+            geoparquet_file,
+            index_path,
+            primary_column,
+            node_size=node_size,
+        )
+        return load_spatial_index(geoparquet_file, index_path, rebuild=False)
+    return index
@@ -0,0 +1,105 @@
+"""For (de)serializing JSON with the fastest available backend.
+
+orjson or msgspec are used if installed (in that order of preference), otherwise the
+standard library json module. The backend can be changed at runtime with
+set_json_backend().
+
+Values that the backend cannot serialize natively are converted with str(), and all
+decode errors are raised as ValueError.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+JSON_BACKENDS: tuple[str, ...] = ("orjson", "msgspec", "json")
+
+_backend: str
+_dumps: Callable[[Any], str]
+_loads: Callable[[str | bytes], Any]
+
+
+def _get_backend_functions(
+    name: str,
+) -> tuple[Callable[[Any], str], Callable[[str | bytes], Any]]:
+    """Gets the (dumps, loads) functions of a backend.
+
+    Raises:
+        ImportError: If the backend is not installed.
+    """
+    if name == "orjson":
+        import orjson
+
+        def _orjson_dumps(obj: Any) -> str:
+            return orjson.dumps(obj, default=str).decode("utf-8")
+
+        return _orjson_dumps, orjson.loads
+
+    if name == "msgspec":
+        import msgspec
+
+        def _msgspec_dumps(obj: Any) -> str:
+            return msgspec.json.encode(obj, enc_hook=str).decode("utf-8")
+
+        def _msgspec_loads(data: str | bytes) -> Any:
+            try:
+                return msgspec.json.decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(f"Invalid JSON: {e}") from e
+
+        return _msgspec_dumps, _msgspec_loads
+
+    if name == "json":
+
+        def _json_dumps(obj: Any) -> str:
+            return json.dumps(obj, default=str)
+
+        return _json_dumps, json.loads
+
+    raise ValueError(f"JSON backend must be one of {JSON_BACKENDS}, not {name}")
+
+
+def set_json_backend(name: Optional[str] = None) -> str:
+    """Sets the JSON backend used for GeoJSON I/O, properties, and metadata.
+
+    Args:
+        name (str, optional): One of 'orjson', 'msgspec', or 'json'. Defaults to None,
+            which selects the fastest installed backend.
+
+    Returns:
+        str: The name of the selected backend.
+    """
+    global _backend, _dumps, _loads
+    if name is None:
+        for candidate in JSON_BACKENDS:
+            try:
+                _dumps, _loads = _get_backend_functions(candidate)
+            except ImportError:
+                continue
+            _backend = candidate
+            break
+        return _backend
+
+    try:
+        _dumps, _loads = _get_backend_functions(name)
+    except ImportError as e:
+        raise ValueError(f"JSON backend={name} is not installed: {e}") from e
+    _backend = name
+    return _backend
+
+
+def get_json_backend() -> str:
+    """Returns the name of the JSON backend in use."""
+    return _backend
+
+
+def dumps(obj: Any) -> str:
+    """Serializes an object to a JSON string with the selected backend."""
+    return _dumps(obj)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserializes a JSON string or bytes with the selected backend."""
+    return _loads(data)
+
+
+set_json_backend()
@@ -1,7 +1,14 @@
 """Pydantic models for GeoParquet metadata."""
 
 import ast
-from pydantic import BeforeValidator, Field, BaseModel, field_validator, model_validator
+from pydantic import (
+    BeforeValidator,
+    Field,
+    BaseModel,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 from typing import Annotated, Optional, Literal, Union
 from pyproj import CRS
 
@@ -63,7 +70,31 @@ class GeometryColumnMetadata(BaseModel):
         ]
     ] = None
 
-    orientation: Literal["counterclockwise"] = "counterclockwise"
+    orientation: Optional[
+        Annotated[
+            Literal["counterclockwise"],
+            Field(description="The winding order of polygon rings, if enforced"),
+        ]
+    ] = None
+
+    covering: Optional[
+        Annotated[
+            dict[str, dict[str, list[str]]],
+            Field(
+                description="Columns covering the geometries, i.e., a bbox struct column with xmin, ymin, xmax, ymax fields"
+            ),
+        ]
+    ] = None
+
+    @model_serializer(mode="wrap")
+    def drop_empty_keys(self, handler):
+        """The GeoParquet JSON schema doesn't allow null 'orientation' or 'covering'
+        values (readers expect them to be set if present), so omit them if None."""
+        data = handler(self)
+        for key in ("orientation", "covering"):
+            if data.get(key) is None:
+                data.pop(key, None)
+        return data
 
     @field_validator("crs")
     @classmethod
@@ -89,6 +120,17 @@ class GeometryColumnMetadata(BaseModel):
             raise ValueError("bbox must be a list of 4 floats!")
         return v
 
+    @field_validator("covering")
+    @classmethod
+    def must_cover_bbox(cls, v):
+        if v is None:
+            return v
+        if set(v.get("bbox", {}).keys()) != {"xmin", "ymin", "xmax", "ymax"}:
+            raise ValueError(
+                "covering must have a 'bbox' with xmin, ymin, xmax, and ymax column paths!"
+            )
+        return v
+
 
 class GeoParquetMetadata(BaseModel):
     version: Annotated[
@@ -112,17 +154,15 @@ class GeoParquetMetadata(BaseModel):
 
     @model_validator(mode="after")
     def convert_geo_to_class(self) -> "GeoParquetMetadata":
-        if not isinstance(self.columns[self.primary_column], GeometryColumnMetadata):
-            if isinstance(self.columns[self.primary_column], str):
-                self.columns[self.primary_column] = ast.literal_eval(
-                    self.columns[self.primary_column]
-                )
-            if isinstance(self.columns[self.primary_column], dict):
-                self.columns[self.primary_column] = GeometryColumnMetadata(
-                    **self.columns[self.primary_column]
-                )
+        for name, column_metadata in self.columns.items():
+            if isinstance(column_metadata, GeometryColumnMetadata):
+                continue
+            if isinstance(column_metadata, str):
+                column_metadata = ast.literal_eval(column_metadata)
+            if isinstance(column_metadata, dict):
+                self.columns[name] = GeometryColumnMetadata(**column_metadata)
             else:
                 raise ValueError(
-                    f"Invalid primary column metadata: {self.columns[self.primary_column]}"
+                    f"Invalid metadata for column={name}: {self.columns[name]}"
                 )
         return self
@@ -4,53 +4,240 @@ Note that validating GeoParquet metadata can be handles with the
 `.schemas` module pydantic classes.
 """
 
-import ast
+import concurrent.futures
+import numpy as np
 import pyarrow
+import pyarrow.parquet
+import shapely
 from geoparquet_pydantic.schemas import (
+    GeometryColumnMetadata,
     GeoParquetMetadata,
 )
-from typing import Optional
+from geoparquet_pydantic.convert import (
+    ArrowStreamExportable,
+    _decode_geo_metadata,
+    _get_arrow_stream,
+    _get_geometry_type_names,
+    _get_max_workers,
+    _get_parquet_file,
+)
+from typing import Iterable, Optional
 from pathlib import Path
 
 
-def _validate_geo_metadata(metadata: dict[bytes, bytes]) -> bool:
+def _get_column_metadata(
+    geo_metadata: GeoParquetMetadata,
+) -> dict[str, GeometryColumnMetadata]:
+    """Gets the metadata of every geometry column as GeometryColumnMetadata."""
+    columns = {}
+    for name, column_metadata in geo_metadata.columns.items():
+        if isinstance(column_metadata, dict):
+            column_metadata = GeometryColumnMetadata(**column_metadata)
+        if not isinstance(column_metadata, GeometryColumnMetadata):
+            raise ValueError(f"Invalid metadata for column={name}: {column_metadata}")
+        columns[name] = column_metadata
+    return columns
+
+
+def _validate_geo_metadata(
+    schema: pyarrow.Schema,
+    primary_column: Optional[str] = None,
+) -> GeoParquetMetadata | None:
     try:
-        geo_metadata = ast.literal_eval(metadata[b"geo"].decode("utf-8"))
-        GeoParquetMetadata(**geo_metadata)
+        geo_metadata = GeoParquetMetadata(
+            **_decode_geo_metadata(schema.metadata or {}),
+        )
+        if primary_column and primary_column != geo_metadata.primary_column:
+            raise ValueError(
+                f"primary_column={primary_column} does not match metadata primary_column={geo_metadata.primary_column}"
+            )
+        for name in _get_column_metadata(geo_metadata).keys():
+            if name not in schema.names:
+                raise ValueError(f"Geometry column={name} not found in the schema.")
         print("Valid GeoParquet metadata!")
-        return True
+        return geo_metadata
     except KeyError as e:
         print(f"Invalid GeoParquet metadata, could not find b'geo' key: {e}")
-    except ValueError as e:
+    except (ValueError, SyntaxError) as e:
         print(f"Invalid GeoParquet metadata: {e}")
-    return False
+    return None
+
+
+def _has_valid_orientation(geometries: np.ndarray) -> bool:
+    """Checks that exterior rings are counterclockwise and interior rings clockwise."""
+    polygons = geometries[np.isin(shapely.get_type_id(geometries), [3, 6, 7])]
+    polygons = shapely.get_parts(polygons)
+    polygons = polygons[shapely.get_type_id(polygons) == 3]
+    rings, polygon_index = shapely.get_rings(polygons, return_index=True)
+    if not len(rings):
+        return True
+    is_exterior = np.r_[True, polygon_index[1:] != polygon_index[:-1]]
+    return bool(np.all(shapely.is_ccw(rings) == is_exterior))
+
+
+def _validate_geo_column_data(
+    name: str,
+    column: pyarrow.Array | pyarrow.ChunkedArray,
+    column_metadata: GeometryColumnMetadata,
+) -> list[str]:
+    """Runs the deep validation checks on one chunk of a geometry column.
+
+    Returns:
+        A list of error messages, empty if the chunk is valid.
+    """
+    try:
+        geometries = shapely.from_wkb(
+            column.to_numpy(zero_copy_only=False),
+            on_invalid="raise",
+        )
+    except (shapely.errors.GEOSException, shapely.errors.ShapelyError) as e:
+        return [f"Could not decode the WKB in column={name}: {e}"]
+
+    errors = []
+    if column_metadata.geometry_types:
+        extra_types = _get_geometry_type_names(geometries) - set(
+            column_metadata.geometry_types
+        )
+        if extra_types:
+            errors.append(
+                f"Column={name} contains geometry types {sorted(extra_types)} not in geometry_types={column_metadata.geometry_types}"
+            )
+
+    if column_metadata.bbox:
+        bounds = shapely.bounds(geometries)
+        if not np.all(np.isnan(bounds)):
+            xmin, ymin = np.nanmin(bounds[:, :2], axis=0)
+            xmax, ymax = np.nanmax(bounds[:, 2:], axis=0)
+            bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax = column_metadata.bbox
+            # a bbox crossing the antimeridian has xmin > xmax, so only y is checked
+            within_x = bbox_xmin > bbox_xmax or (
+                xmin >= bbox_xmin and xmax <= bbox_xmax
+            )
+            within_y = ymin >= bbox_ymin and ymax <= bbox_ymax
+            if not (within_x and within_y):
+                errors.append(
+                    f"Column={name} geometries with bounds {[xmin, ymin, xmax, ymax]} fall outside bbox={column_metadata.bbox}"
+                )
+
+    if column_metadata.orientation:
+        if not _has_valid_orientation(geometries):
+            errors.append(
+                f"Column={name} contains polygons not oriented {column_metadata.orientation}"
+            )
+    return errors
+
+
+def _validate_geo_chunk(
+    chunk: pyarrow.Table | pyarrow.RecordBatch,
+    columns_metadata: dict[str, GeometryColumnMetadata],
+) -> list[str]:
+    errors = []
+    for name, column_metadata in columns_metadata.items():
+        errors.extend(
+            _validate_geo_column_data(name, chunk.column(name), column_metadata)
+        )
+    return errors
+
+
+def _validate_geo_data(
+    chunks: Iterable[pyarrow.Table | pyarrow.RecordBatch],
+    geo_metadata: GeoParquetMetadata,
+    max_workers: Optional[int] = None,
+    fail_fast: bool = False,
+) -> bool:
+    """Validates the geometry data chunk by chunk, optionally in parallel.
+
+    Chunks are only read as workers become free, so at most ~max_workers chunks are
+    held in memory at once.
+    """
+    columns_metadata = _get_column_metadata(geo_metadata)
+    max_workers = _get_max_workers(max_workers)
+    errors: list[str] = []
+
+    if not max_workers:
+        for chunk in chunks:
+            errors.extend(_validate_geo_chunk(chunk, columns_metadata))
+            if errors and fail_fast:
+                break
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            pending: set[concurrent.futures.Future] = set()
+            for chunk in chunks:
+                pending.add(
+                    executor.submit(_validate_geo_chunk, chunk, columns_metadata)
+                )
+                if len(pending) >= max_workers:
+                    done, pending = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    errors.extend(e for future in done for e in future.result())
+                    if errors and fail_fast:
+                        break
+            if errors and fail_fast:
+                for future in pending:
+                    future.cancel()
+            else:
+                for future in concurrent.futures.as_completed(pending):
+                    errors.extend(future.result())
+
+    for error in errors:
+        print(f"Invalid GeoParquet data: {error}")
+    if not errors:
+        print("Valid GeoParquet data!")
+    return not errors
 
 
 def validate_geoparquet_table(
-    table: pyarrow.Table,
+    table: pyarrow.Table | pyarrow.RecordBatchReader | ArrowStreamExportable,
     primary_column: Optional[str] = None,
+    deep: bool = False,
+    max_workers: Optional[int] = None,
+    fail_fast: bool = False,
 ) -> bool:
     """Validates a the GeoParquet metadata of a pyarrow.Table.
 
     See: https://github.com/opengeospatial/geoparquet/blob/main/format-specs/geoparquet.md
 
     Args:
-        table (pyarrow.Table): The table to validate.
+        table (pyarrow.Table | RecordBatchReader | ArrowStreamExportable): The table to
+            validate. Arrow streams (i.e., implementing __arrow_c_stream__) are only
+            consumed if deep=True, one batch at a time.
         primary_column (Optional[str], optional): The name of the primary geometry column.
-            Defaults to None.
+            Must match the metadata if provided. Defaults to None.
+        deep (bool, default=False): Whether to also validate the geometry data. Checks
+            that the WKB of every geometry column decodes, that geometry types are within
+            'geometry_types', that geometries fall within 'bbox', and that polygons
+            match 'orientation' (if declared).
+        max_workers (int, optional): The maximum number of threads used to validate
+            record batches in parallel when deep=True. Defaults to 0 (runs sequentially).
+            Use -1 for all available cores.
+        fail_fast (bool, default=False): Stop the deep validation at the first invalid batch.
 
     Returns:
-        bool: True if the metadata is valid, False otherwise.
+        bool: True if the metadata (and data if deep=True) is valid, False otherwise.
     """
-    if not primary_column:
-        primary_column = "geometry"
-    return _validate_geo_metadata(table.schema.metadata)
+    schema, batches = _get_arrow_stream(table)
+    geo_metadata = _validate_geo_metadata(schema, primary_column)
+    if not geo_metadata:
+        return False
+    if not deep:
+        return True
+    return _validate_geo_data(
+        batches,
+        geo_metadata,
+        max_workers=max_workers,
+        fail_fast=fail_fast,
+    )
 
 
 def validate_geoparquet_file(
     geoparquet_file: str | Path | pyarrow.parquet.ParquetFile,
     primary_column: Optional[str] = None,
     read_file_kwargs: Optional[dict] = None,
+    deep: bool = False,
+    max_workers: Optional[int] = None,
+    fail_fast: bool = False,
 ) -> bool:
     """Validates that a parquet file has correct GeoParquet metadata without opening it.
 
@@ -58,34 +245,34 @@ def validate_geoparquet_file(
 
     Args:
         geoparquet_file (str | Path | ParquetFile): The file to validate.
-        primary_column (str, optional): The primary column name. Defaults to 'geometry'.
+        primary_column (str, optional): The primary column name. Must match the metadata
+            if provided. Defaults to None.
         read_file_kwargs (dict, optional): Kwargs to be passed into pyarrow.parquet.ParquetFile().
             See: https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html#pyarrow-parquet-parquetfile
+        deep (bool, default=False): Whether to also validate the geometry data, one row
+            group at a time. See validate_geoparquet_table() for the checks run.
+        max_workers (int, optional): The maximum number of threads used to validate
+            row groups in parallel when deep=True. Defaults to 0 (runs sequentially).
+            Use -1 for all available cores.
+        fail_fast (bool, default=False): Stop the deep validation at the first invalid row group.
 
     Returns:
-        bool: True if the metadata is valid, False otherwise.
+        bool: True if the metadata (and data if deep=True) is valid, False otherwise.
     """
-    if not primary_column:
-        primary_column = "geometry"
-    default_read_file_kwargs = {
-        "memory_map": True,
-    }
-    if read_file_kwargs is None:
-        read_file_kwargs = default_read_file_kwargs
-    elif isinstance(read_file_kwargs, dict):
-        for k, v in default_read_file_kwargs.items():
-            if k not in read_file_kwargs:
-                read_file_kwargs[k] = v
-    else:
-        raise TypeError(f"Optional param:read_file_kwargs must be a dict or None!")
+    geoparquet_file = _get_parquet_file(geoparquet_file, read_file_kwargs)
+    geo_metadata = _validate_geo_metadata(geoparquet_file.schema_arrow, primary_column)
+    if not geo_metadata:
+        return False
+    if not deep:
+        return True
 
-    if isinstance(geoparquet_file, (str, Path)):
-        geoparquet_file = pyarrow.parquet.ParquetFile(
-            geoparquet_file,
-            **read_file_kwargs,
-        )
-    if not isinstance(geoparquet_file, pyarrow.parquet.ParquetFile):
-        raise TypeError(
-            "Input must be a file path (str | Path) or a ParquetFile object!"
-        )
-    return _validate_geo_metadata(geoparquet_file.schema_arrow.metadata)
+    geo_columns = list(geo_metadata.columns.keys())
+    return _validate_geo_data(
+        (
+            geoparquet_file.read_row_group(i, columns=geo_columns)
+            for i in range(geoparquet_file.num_row_groups)
+        ),
+        geo_metadata,
+        max_workers=max_workers,
+        fail_fast=fail_fast,
+    )
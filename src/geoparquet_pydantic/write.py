@@ -0,0 +1,259 @@
+"""For writing GeoParquet files with tuned row group, encoding, and statistics settings.
+
+Each preset trades off write speed, file size, and spatial read speed:
+    fast-write: snappy compression, no dictionaries or statistics, large row groups.
+    small-file: zstd compression, dictionaries for low cardinality property columns.
+    fast-spatial-read: rows sorted along a hilbert curve, a bbox covering column with
+        statistics and page indexes, and small row groups, so that readers can skip
+        the row groups and pages outside of a bbox filter.
+
+Row group sizes are chosen from the mean primary geometry WKB size, so that each row
+group holds a predictable number of geometry bytes regardless of geometry complexity.
+"""
+
+import numpy as np
+import pyarrow
+import pyarrow.compute
+import pyarrow.parquet
+import shapely
+from geojson_pydantic.features import FeatureCollection
+from geoparquet_pydantic.schemas import (
+    GeometryColumnMetadata,
+    GeoParquetMetadata,
+)
+from geoparquet_pydantic.convert import (
+    _decode_geo_metadata,
+    _encode_metadata,
+    _get_bbox,
+    geojson_to_geoparquet,
+)
+from geoparquet_pydantic.index import _hilbert_order
+from pathlib import Path
+from typing import Any, Optional
+
+BBOX_COLUMN_NAME = "bbox"
+
+WRITE_PRESETS: dict[str, dict[str, Any]] = {
+    "fast-write": {
+        "row_group_bytes": 128 * 1024**2,
+        "compression": "snappy",
+        "dictionary": False,
+        "statistics": False,
+        "covering_bbox": False,
+        "write_table_kwargs": {},
+    },
+    "small-file": {
+        "row_group_bytes": 128 * 1024**2,
+        "compression": "zstd",
+        "dictionary": True,
+        "statistics": True,
+        "covering_bbox": False,
+        "write_table_kwargs": {"compression_level": 9},
+    },
+    "fast-spatial-read": {
+        "row_group_bytes": 16 * 1024**2,
+        "compression": "zstd",
+        "dictionary": True,
+        "statistics": True,
+        "covering_bbox": True,
+        "write_table_kwargs": {
+            "write_page_index": True,
+            "data_page_size": 64 * 1024,
+        },
+    },
+}
+
+# the maximum ratio of distinct values to rows for a column to be dictionary encoded
+_DICTIONARY_MAX_RATIO = 0.5
+
+# pyarrow's default (and maximum useful) number of rows per row group
+_MAX_ROW_GROUP_SIZE = 1024**2
+
+
+def _get_row_group_size(column: pyarrow.ChunkedArray, row_group_bytes: int) -> int:
+    """Gets the number of rows per row group holding ~param:row_group_bytes of WKB."""
+    if not len(column):
+        return _MAX_ROW_GROUP_SIZE
+    total_bytes = pyarrow.compute.sum(pyarrow.compute.binary_length(column)).as_py()
+    mean_bytes = max((total_bytes or 0) / len(column), 1)
+    return int(min(max(row_group_bytes // mean_bytes, 1), _MAX_ROW_GROUP_SIZE))
+
+
+def _get_dictionary_columns(
+    table: pyarrow.Table,
+    geometry_columns: list[str],
+) -> list[str]:
+    """Gets the property columns with few enough distinct values to dictionary encode."""
+    columns = []
+    for name in table.column_names:
+        column = table.column(name)
+        if (
+            name in geometry_columns
+            or not len(column)
+            or pyarrow.types.is_nested(column.type)
+        ):
+            continue
+        try:
+            num_distinct = pyarrow.compute.count_distinct(column).as_py()
+        except pyarrow.ArrowNotImplementedError:
+            continue
+        if num_distinct <= _DICTIONARY_MAX_RATIO * len(column):
+            columns.append(name)
+    return columns
+
+
+def _add_covering_bbox(
+    table: pyarrow.Table,
+    geo_metadata: GeoParquetMetadata,
+    bounds: np.ndarray,
+) -> tuple[pyarrow.Table, GeoParquetMetadata]:
+    """Adds a bbox struct column covering the primary geometries, and its metadata.
+
+    An existing bbox column declared as a covering (i.e., in a file written with this
+    preset) is replaced, since the rows may have changed.
+    """
+    if BBOX_COLUMN_NAME in table.column_names:
+        if not any(
+            path[0] == BBOX_COLUMN_NAME
+            for column_metadata in geo_metadata.columns.values()
+            if isinstance(column_metadata, GeometryColumnMetadata)
+            for path in ((column_metadata.covering or {}).get("bbox") or {}).values()
+        ):
+            raise ValueError(
+                f"Cannot add a covering bbox, column={BBOX_COLUMN_NAME} already exists."
+            )
+        table = table.drop_columns([BBOX_COLUMN_NAME])
+    fields = ["xmin", "ymin", "xmax", "ymax"]
+    nulls = np.isnan(bounds).any(axis=1)
+    bbox_column = pyarrow.StructArray.from_arrays(
+        [pyarrow.array(bounds[:, i], mask=nulls) for i in range(4)],
+        names=fields,
+        mask=pyarrow.array(nulls),
+    )
+    table = table.append_column(BBOX_COLUMN_NAME, bbox_column)
+
+    column_metadata = geo_metadata.columns[geo_metadata.primary_column]
+    columns = dict(geo_metadata.columns)
+    columns[geo_metadata.primary_column] = column_metadata.model_copy(
+        update={
+            "covering": {
+                "bbox": {name: [BBOX_COLUMN_NAME, name] for name in fields},
+            },
+        }
+    )
+    return table, geo_metadata.model_copy(update={"columns": columns})
+
+
+def write_geoparquet(
+    table: pyarrow.Table | FeatureCollection | Path,
+    where: str | Path,
+    preset: str = "small-file",
+    row_group_bytes: Optional[int] = None,
+    write_table_kwargs: Optional[dict] = None,
+) -> Path:
+    """Writes a GeoParquet file with a tuned row group, encoding, and statistics preset.
+
+    Args:
+        table (pyarrow.Table | FeatureCollection | Path): An Arrow table with GeoParquet
+            metadata, or a GeoJSON Pydantic FeatureCollection (or GeoJSON file) which
+            is converted with geojson_to_geoparquet() defaults.
+        where (str | Path): The parquet file to write.
+        preset (str, default='small-file'): One of 'fast-write', 'small-file', or
+            'fast-spatial-read'. Note that 'fast-spatial-read' sorts the rows along a
+            hilbert curve and adds (or recomputes) a 'bbox' covering column.
+        row_group_bytes (int, optional): The target primary geometry WKB bytes per row
+            group. Defaults to the preset's (128MB, or 16MB for 'fast-spatial-read').
+        write_table_kwargs (dict, optional): Kwargs to be passed into
+            pyarrow.parquet.write_table(), overriding the preset's.
+
+    Returns:
+        Path: The path of the written GeoParquet file.
+    """
+    if preset not in WRITE_PRESETS:
+        raise ValueError(f"param:preset must be one of {list(WRITE_PRESETS.keys())}")
+    if write_table_kwargs is None:
+        write_table_kwargs = {}
+    elif not isinstance(write_table_kwargs, dict):
+        raise TypeError(f"Optional param:write_table_kwargs must be a dict or None!")
+    settings = WRITE_PRESETS[preset]
+    if not row_group_bytes:
+        row_group_bytes = settings["row_group_bytes"]
+
+    if not isinstance(table, pyarrow.Table):
+        table = geojson_to_geoparquet(table)
+    if not table.schema.metadata or b"geo" not in table.schema.metadata:
+        raise ValueError("param:table must have GeoParquet metadata (b'geo' key).")
+    geo_metadata = GeoParquetMetadata(**_decode_geo_metadata(table.schema.metadata))
+    geometry_columns = list(geo_metadata.columns.keys())
+    primary_column = geo_metadata.primary_column
+    # binary_length and take have no binary_view kernels (i.e., Polars to_arrow())
+    for name in geometry_columns:
+        index = table.schema.get_field_index(name)
+        if index != -1 and pyarrow.types.is_binary_view(table.schema.field(index).type):
+            table = table.set_column(
+                index,
+                table.schema.field(index).with_type(pyarrow.large_binary()),
+                table.column(index).cast(pyarrow.large_binary()),
+            )
+    dictionary_columns: bool | list[str] = False
+    if settings["dictionary"]:
+        dictionary_columns = _get_dictionary_columns(table, geometry_columns)
+
+    if settings["covering_bbox"]:
+        geometries = shapely.from_wkb(
+            table.column(primary_column).to_numpy(zero_copy_only=False),
+        )
+        bounds = shapely.bounds(geometries)
+        valid = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+        if len(valid):
+            # null and empty geometries go last
+            order = np.concatenate(
+                [
+                    valid[_hilbert_order(bounds[valid])],
+                    np.flatnonzero(np.isnan(bounds).any(axis=1)),
+                ]
+            )
+            table = table.take(order)
+            bounds = bounds[order]
+        column_metadata = geo_metadata.columns[primary_column]
+        if isinstance(column_metadata, GeometryColumnMetadata) and not (
+            column_metadata.bbox
+        ):
+            geo_metadata.columns[primary_column] = column_metadata.model_copy(
+                update={"bbox": _get_bbox(geometries)},
+            )
+        table, geo_metadata = _add_covering_bbox(table, geo_metadata, bounds)
+
+    # statistics are useless on WKB, but are what readers filter the bbox with
+    statistics: bool | list[str] = False
+    if settings["statistics"]:
+        statistics = [
+            name
+            for name in table.flatten().column_names
+            if name not in geometry_columns
+        ]
+
+    kwargs: dict[str, Any] = {
+        "row_group_size": _get_row_group_size(
+            table.column(primary_column),
+            row_group_bytes,
+        ),
+        "compression": settings["compression"],
+        "use_dictionary": dictionary_columns,
+        "write_statistics": statistics,
+        **settings["write_table_kwargs"],
+        **write_table_kwargs,
+    }
+
+    where = Path(where)
+    pyarrow.parquet.write_table(
+        table.replace_schema_metadata(
+            {
+                **table.schema.metadata,
+                **_encode_metadata({"geo": geo_metadata.model_dump()}),
+            }
+        ),
+        where,
+        **kwargs,
+    )
+    return where
@@ -4,6 +4,7 @@ import pyarrow
 from pathlib import Path
 import geojson_pydantic
 import geopandas as gpd
+import pandas as pd
 import pyarrow.parquet
 from geojson_pydantic.features import FeatureCollection
 
@@ -11,14 +12,29 @@ from geoparquet_pydantic.schemas import (
     GeoParquetMetadata,
 )
 from geoparquet_pydantic.convert import (
-    _to_wkb,
+    GeoParquetConverter,
+    _geojson_to_wkb,
     _get_geom_types,
+    _get_geometry_type_names,
     _get_default_geo_metadata,
     _update_metadata,
-    _validate_column_schema,
+    _validate_feature_properties,
+    _batch_to_records,
+    _estimate_wkb_size,
+    _slice_batches,
+    _get_geoparquet_stream,
+    _get_parquet_file,
+    _decode_geo_metadata,
+    _fill_geo_metadata,
+    _map_in_order,
     geojson_to_geoparquet,
+    geojson_to_geoparquet_reader,
     geoparquet_to_geojson,
+    geoparquet_to_geojson_file,
+    iter_geojson_features,
 )
+import numpy as np
+import pyproj
 import shapely
 
 from geoparquet_pydantic.validate import validate_geoparquet_file
@@ -52,16 +68,18 @@ def mock_table() -> pyarrow.Table:
     return table
 
 
-def test_to_wkb(
-    geometry_type_examples: dict[str, geojson_pydantic.geometries._GeometryBase]
+def test_geojson_to_wkb(
+    geometry_type_examples: dict[str, geojson_pydantic.geometries._GeometryBase],
 ):
-    """Test the conversion of a GeoJSON object to WKB format."""
-    for k, v in geometry_type_examples.items():
-        wkb = _to_wkb(v)
+    """Test the conversion of GeoJSON objects to WKB format."""
+    wkbs, geometries = _geojson_to_wkb([*geometry_type_examples.values(), None])
+    assert wkbs[-1] is None and geometries[-1] is None
+    for k, wkb, geometry in zip(geometry_type_examples.keys(), wkbs, geometries):
         assert isinstance(wkb, bytes)
         assert len(wkb) > 0
         back_in = shapely.wkb.loads(wkb)
         assert isinstance(back_in, getattr(shapely.geometry, k))
+        assert shapely.equals_exact(back_in, geometry)
 
 
 def test_get_geom_types(
@@ -81,6 +99,22 @@ def test_get_geom_types(
         "GeometryCollection",
     }
 
+    # the same type names that deep validation derives from the parsed geometries
+    for wkt in [
+        "POINT Z (1 2 3)",
+        "MULTIPOLYGON Z (((0 0 0, 1 0 0, 1 1 0, 0 0 0)))",
+        "GEOMETRYCOLLECTION Z (POINT Z (0 0 0), LINESTRING Z (0 0 0, 1 1 1))",
+    ]:
+        geometry = shapely.from_wkt(wkt)
+        feature = geojson_pydantic.Feature(
+            type="Feature",
+            geometry=json.loads(shapely.to_geojson(geometry)),
+            properties={},
+        )
+        assert _get_geom_types([feature]) == sorted(
+            _get_geometry_type_names(np.array([geometry]))
+        )
+
 
 def test_get_default_geo_metadata(
     valid_geojson_obj: FeatureCollection,
@@ -91,6 +125,37 @@ def test_get_default_geo_metadata(
         valid_geojson_obj.features
     )
 
+    # 3D geometries get a Z suffix
+    feature_collection = FeatureCollection(
+        type="FeatureCollection",
+        features=[
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1, 2, 3]},
+                "properties": {},
+            }
+        ],
+    )
+    default_metadata = _get_default_geo_metadata(feature_collection)
+    assert default_metadata.columns["geometry"].geometry_types == ["PointZ"]
+
+
+def test_fill_geo_metadata():
+    geometries = {
+        "geometry": np.array([shapely.Point(1, 2, 3), None, shapely.box(0, 0, 1, 1)])
+    }
+    geo_metadata = {
+        "primary_column": "geometry",
+        "columns": {"geometry": {"encoding": "WKB", "geometry_types": []}},
+    }
+    filled = _fill_geo_metadata(geo_metadata, geometries)
+    assert filled["columns"]["geometry"]["bbox"] == [0, 0, 1, 2]
+    assert filled["columns"]["geometry"]["geometry_types"] == ["PointZ", "Polygon"]
+    assert geo_metadata["columns"]["geometry"]["geometry_types"] == []
+
+    # complete metadata is returned as is
+    assert _fill_geo_metadata(filled, geometries) is filled
+
 
 def test_update_metadata(
     mock_table: pyarrow.Table,
@@ -102,7 +167,7 @@ def test_update_metadata(
     assert b"key" in new_table.schema.metadata
 
 
-def test_validate_column_schema(
+def test_validate_feature_properties(
     valid_geojson_obj: FeatureCollection,
 ):
     # make updated FeatureCollection properties
@@ -116,16 +181,16 @@ def test_validate_column_schema(
         ]
     )
     # test with valid schema
-    _validate_column_schema(
+    _validate_feature_properties(
         mock_schema,
         primary_column="geometry",
-        geojson=valid_geojson_obj,
+        features=valid_geojson_obj.features,
         add_none_values=False,
     )
-    _validate_column_schema(
+    _validate_feature_properties(
         mock_schema,
         primary_column="geometry",
-        geojson=valid_geojson_obj,
+        features=valid_geojson_obj.features,
         add_none_values=True,
     )
 
@@ -135,18 +200,18 @@ def test_validate_column_schema(
             feature.properties = {}
             assert not feature.properties
     with pytest.raises(ValueError):
-        _validate_column_schema(
+        _validate_feature_properties(
             mock_schema,
             "geometry",
-            valid_geojson_obj,
+            valid_geojson_obj.features,
             False,
         )
 
     # now test that it can add Nones
-    _validate_column_schema(
+    _validate_feature_properties(
         mock_schema,
         "geometry",
-        valid_geojson_obj,
+        valid_geojson_obj.features,
         True,
     )
 
@@ -208,6 +273,52 @@ def test_geojson_to_geoparquet(
     parquet_path.unlink()
 
 
+def test_parallel_geojson_to_geoparquet(
+    valid_geojson_obj: FeatureCollection,
+):
+    """Test that encoding chunks of features in parallel preserves the feature order."""
+    features = valid_geojson_obj.features * 20
+    geojson = FeatureCollection(type="FeatureCollection", features=features)
+    column_schema = pyarrow.schema([("name", pyarrow.string())])
+    table = geojson_to_geoparquet(geojson, column_schema=column_schema)
+    for max_workers in [2, 3, -1]:
+        parallel_table = geojson_to_geoparquet(
+            geojson,
+            column_schema=column_schema,
+            max_workers=max_workers,
+        )
+        parallel_table.validate(full=True)
+        assert parallel_table.equals(table, check_metadata=True)
+
+    # empty collections still get the full schema
+    empty_geojson = FeatureCollection(type="FeatureCollection", features=[])
+    empty_table = geojson_to_geoparquet(
+        empty_geojson,
+        column_schema=column_schema,
+        max_workers=2,
+    )
+    assert empty_table.num_rows == 0
+    assert empty_table.schema.equals(table.schema)
+
+    with pytest.raises(ValueError):
+        geojson_to_geoparquet(geojson, max_workers=-2)
+
+
+def test_map_in_order():
+    """Test that a lazy stream is only read as parallel results are consumed."""
+    pulled = []
+
+    def items():
+        for i in range(20):
+            pulled.append(i)
+            yield i
+
+    results = _map_in_order(lambda i: i * 2, items(), 3)
+    assert next(results) == 0
+    assert len(pulled) <= 3
+    assert list(results) == [i * 2 for i in range(1, 20)]
+
+
 def test_bad_geojson_to_geoparquet(
     valid_geojson_obj: FeatureCollection,
 ):
@@ -240,6 +351,42 @@ def test_bad_geojson_to_geoparquet(
         )
 
 
+def test_geojson_to_geoparquet_reader(
+    valid_geojson_obj: FeatureCollection,
+):
+    """Test streaming a GeoJSON object as GeoParquet record batches."""
+    reader = geojson_to_geoparquet_reader(valid_geojson_obj, batch_size=3)
+    assert isinstance(reader, pyarrow.RecordBatchReader)
+    assert b"geo" in reader.schema.metadata
+
+    batches = list(reader)
+    assert [len(b) for b in batches] == [3, 3, 1]
+    table = pyarrow.Table.from_batches(batches, schema=reader.schema)
+    assert table.equals(geojson_to_geoparquet(valid_geojson_obj))
+
+    # streamed batches can't compute the bbox ahead of time
+    expected = _decode_geo_metadata(
+        geojson_to_geoparquet(valid_geojson_obj).schema.metadata
+    )
+    expected["columns"]["geometry"]["bbox"] = None
+    assert _decode_geo_metadata(table.schema.metadata) == expected
+
+    # the reader can be written straight to a file
+    parquet_path = Path("test.parquet")
+    reader = geojson_to_geoparquet_reader(valid_geojson_obj, batch_size=2)
+    with pyarrow.parquet.ParquetWriter(parquet_path, reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+    geojson = geoparquet_to_geojson(parquet_path)
+    assert len(geojson.features) == len(valid_geojson_obj.features)
+    gdf = gpd.read_parquet(parquet_path)
+    assert len(gdf) == len(valid_geojson_obj.features)
+    parquet_path.unlink()
+
+    with pytest.raises(ValueError):
+        geojson_to_geoparquet_reader(valid_geojson_obj, batch_size=-1)
+
+
 def test_valid_geoparquet_to_geojson(
     valid_geoparquet_file: Path,
 ):
@@ -271,6 +418,418 @@ def test_valid_geoparquet_to_geojson(
         assert len(feature.bbox) == 4
 
 
+def test_max_batch_bytes(
+    valid_geojson_obj: FeatureCollection,
+):
+    """Test sizing batches by WKB bytes when reading and writing."""
+    for feature in valid_geojson_obj.features:
+        wkb = _geojson_to_wkb([feature.geometry])[0][0]
+        assert _estimate_wkb_size(feature.geometry) == len(wkb)
+
+    # the headers of every part and ring are counted
+    for wkt in [
+        "MULTIPOINT (" + ", ".join(f"({i} {i})" for i in range(1000)) + ")",
+        "MULTIPOINT Z ((0 0 0), (1 1 1))",
+        "POLYGON Z ((0 0 0, 1 0 0, 1 1 0, 0 0 0), (0.1 0.1 0, 0.2 0.1 0, 0.1 0.2 0, 0.1 0.1 0))",
+        "MULTILINESTRING ((0 0, 1 1), (2 2, 3 3, 4 4))",
+        "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)), ((2 2, 3 2, 3 3, 2 2)))",
+        "GEOMETRYCOLLECTION (POINT (0 0), MULTILINESTRING ((0 0, 1 1), (1 1, 2 2)))",
+    ]:
+        geometry = shapely.from_wkt(wkt)
+        geojson = getattr(geojson_pydantic, geometry.geom_type)(
+            **json.loads(shapely.to_geojson(geometry))
+        )
+        assert _estimate_wkb_size(geojson) == len(shapely.to_wkb(geometry)), wkt
+
+    # writes are sized from vertex counts
+    reader = geojson_to_geoparquet_reader(valid_geojson_obj, max_batch_bytes=150)
+    batches = list(reader)
+    assert sum(len(b) for b in batches) == len(valid_geojson_obj.features)
+    assert 1 < len(batches) < len(valid_geojson_obj.features)
+    for batch in batches:
+        if len(batch) > 1:
+            assert sum(len(g) for g in batch.column("geometry").to_pylist()) <= 150
+    reader = geojson_to_geoparquet_reader(
+        valid_geojson_obj,
+        batch_size=1,
+        max_batch_bytes=10_000,
+    )
+    assert len(list(reader)) == len(valid_geojson_obj.features)
+    with pytest.raises(ValueError):
+        geojson_to_geoparquet_reader(valid_geojson_obj, max_batch_bytes=-1)
+
+    # reads are sized from WKB lengths
+    table = geojson_to_geoparquet(valid_geojson_obj)
+    wkb_lengths = [len(g) for g in table.column("geometry").to_pylist()]
+    slices = list(_slice_batches(table.to_batches(), None, 150, "geometry"))
+    assert sum(len(b) for b in slices) == len(table)
+    offset = 0
+    for batch in slices:
+        batch_lengths = wkb_lengths[offset : offset + len(batch)]
+        assert len(batch) == 1 or sum(batch_lengths) <= 150
+        offset += len(batch)
+
+    # a single geometry larger than the budget is still converted
+    slices = list(_slice_batches(table.to_batches(), None, 1, "geometry"))
+    assert [len(b) for b in slices] == [1] * len(table)
+    slices = list(_slice_batches(table.to_batches(), 2, 10_000, "geometry"))
+    assert [len(b) for b in slices] == [2, 2, 2, 1]
+
+    geojson = geoparquet_to_geojson(table, max_batch_bytes=150)
+    assert geojson == geoparquet_to_geojson(table)
+
+    # binary_view WKB columns (i.e., exported by Polars) are sized the same way
+    index = table.schema.get_field_index("geometry")
+    view_table = table.set_column(
+        index,
+        table.schema.field(index).with_type(pyarrow.binary_view()),
+        table.column(index).cast(pyarrow.binary_view()),
+    )
+    slices = list(_slice_batches(view_table.to_batches(), 2, 10_000, "geometry"))
+    assert [len(b) for b in slices] == [2, 2, 2, 1]
+    assert geoparquet_to_geojson(view_table, max_batch_bytes=150) == geojson
+
+
+def test_batch_to_records():
+    """Test converting wide record batches to per-row properties dicts."""
+    n_columns = 150
+    batch = pyarrow.RecordBatch.from_pydict(
+        {
+            "geometry": [shapely.to_wkb(shapely.Point(i, i)) for i in range(3)],
+            **{f"col{c}": [c * 10 + i for i in range(3)] for c in range(n_columns)},
+        }
+    )
+    records = _batch_to_records(batch, "geometry")
+    assert len(records) == 3
+    for i, record in enumerate(records):
+        assert "geometry" not in record
+        assert len(record) == n_columns
+        assert record["col0"] == i
+        assert record[f"col{n_columns - 1}"] == (n_columns - 1) * 10 + i
+
+    geojson = geoparquet_to_geojson(pyarrow.Table.from_batches([batch]))
+    assert [f.properties for f in geojson.features] == records
+
+    # only a geometry column
+    assert _batch_to_records(batch.select(["geometry"]), "geometry") == [{}, {}, {}]
+
+
+class MockArrowStream:
+    """Mocks a DuckDB/Polars result only exposing the Arrow PyCapsule stream protocol."""
+
+    def __init__(self, table: pyarrow.Table):
+        self.table = table
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        return self.table.__arrow_c_stream__(requested_schema)
+
+
+def test_arrow_stream_geoparquet_to_geojson(
+    valid_geoparquet_table: pyarrow.Table,
+):
+    """Test converting RecordBatchReaders and Arrow PyCapsule streams."""
+    expected = geoparquet_to_geojson(valid_geoparquet_table)
+
+    reader = pyarrow.RecordBatchReader.from_batches(
+        valid_geoparquet_table.schema,
+        valid_geoparquet_table.to_batches(max_chunksize=2),
+    )
+    geojson = geoparquet_to_geojson(reader, max_chunksize=3)
+    assert geojson == expected
+
+    geojson = geoparquet_to_geojson(MockArrowStream(valid_geoparquet_table))
+    assert geojson == expected
+
+    # stream the features lazily
+    features = iter_geojson_features(
+        MockArrowStream(valid_geoparquet_table),
+        max_chunksize=1,
+    )
+    assert not isinstance(features, list)
+    assert list(features) == expected.features
+
+
+def test_simplify_and_coordinate_precision(tmp_path: Path):
+    """Test simplifying and rounding geometries on output."""
+    line = shapely.LineString([(i / 7, (i % 2) / 1000 + i / 3) for i in range(100)])
+    table = pyarrow.Table.from_pydict(
+        {"geometry": [shapely.to_wkb(line)], "name": ["line"]},
+    )
+
+    geojson = geoparquet_to_geojson(table, coordinate_precision=2)
+    coordinates = geojson.features[0].geometry.coordinates
+    assert len(coordinates) == 100
+    for x, y in coordinates:
+        assert round(x, 2) == x and round(y, 2) == y
+
+    geojson = geoparquet_to_geojson(table, simplify_tolerance=0.01)
+    assert len(geojson.features[0].geometry.coordinates) < 10
+    features = list(iter_geojson_features(table, simplify_tolerance=0.01))
+    assert features == geojson.features
+    converter = GeoParquetConverter(column_schema=table.schema)
+    assert converter.to_geojson(table, simplify_tolerance=0.01).features == features
+
+    # the file writer streams the same features
+    geojson_path = geoparquet_to_geojson_file(
+        table,
+        tmp_path / "line.geojson",
+        simplify_tolerance=0.01,
+        coordinate_precision=3,
+    )
+    written = FeatureCollection(**json.loads(geojson_path.read_text()))
+    assert written == geoparquet_to_geojson(
+        table,
+        simplify_tolerance=0.01,
+        coordinate_precision=3,
+    )
+
+
+def test_geoparquet_to_geojson_file(
+    valid_geoparquet_file: Path,
+    tmp_path: Path,
+):
+    """Test streaming GeoParquet to a GeoJSON file."""
+    geojson_path = geoparquet_to_geojson_file(
+        valid_geoparquet_file,
+        tmp_path / "valid.geojson",
+        max_chunksize=2,
+    )
+    written = FeatureCollection(**json.loads(geojson_path.read_text()))
+    assert written == geoparquet_to_geojson(valid_geoparquet_file)
+
+    # empty inputs are still valid GeoJSON
+    empty_table = pyarrow.parquet.read_table(valid_geoparquet_file).slice(0, 0)
+    geojson_path = geoparquet_to_geojson_file(empty_table, tmp_path / "empty.geojson")
+    assert FeatureCollection(**json.loads(geojson_path.read_text())).features == []
+
+
+def test_reprojection(
+    valid_geojson_obj: FeatureCollection,
+    tmp_path: Path,
+):
+    """Test reprojecting to Web Mercator on write and back to CRS84 on read."""
+    geo_metadata = _get_default_geo_metadata(valid_geojson_obj)
+    geo_metadata.columns["geometry"].bbox = [0, 0, 26, 26]
+    column_schema = pyarrow.schema([("name", pyarrow.string())])
+    table = geojson_to_geoparquet(
+        valid_geojson_obj,
+        column_schema=column_schema,
+        geo_metadata=geo_metadata,
+        target_crs="EPSG:3857",
+    )
+    column_metadata = _decode_geo_metadata(table.schema.metadata)["columns"]["geometry"]
+    assert pyproj.CRS.from_user_input(column_metadata["crs"]) == pyproj.CRS("EPSG:3857")
+
+    transformer = pyproj.Transformer.from_crs("OGC:CRS84", "EPSG:3857", always_xy=True)
+    xmin, ymin, xmax, ymax = column_metadata["bbox"]
+    assert (xmin, ymin) == (0, 0)
+    assert np.allclose((xmax, ymax), transformer.transform(26, 26))
+
+    geometries = shapely.from_wkb(table.column("geometry").to_numpy())
+    original_geometries = [
+        shapely.from_geojson(f.geometry.model_dump_json(exclude_none=True))
+        for f in valid_geojson_obj.features
+    ]
+    for geometry, original in zip(geometries, original_geometries):
+        assert shapely.has_z(geometry) == shapely.has_z(original)
+        x, y = shapely.get_coordinates(original).T
+        assert np.allclose(
+            shapely.get_coordinates(geometry),
+            np.column_stack(transformer.transform(x, y)),
+        )
+
+    # the same parallel output
+    assert table.equals(
+        geojson_to_geoparquet(
+            valid_geojson_obj,
+            column_schema=column_schema,
+            geo_metadata=geo_metadata,
+            target_crs="EPSG:3857",
+            max_workers=2,
+        ),
+        check_metadata=True,
+    )
+
+    # back to CRS84 on read
+    geojson = geoparquet_to_geojson(table, target_crs="OGC:CRS84")
+    assert np.allclose(geojson.bbox, [0, 0, 26, 26])
+    for feature, original in zip(geojson.features, original_geometries):
+        geometry = shapely.from_geojson(feature.geometry.model_dump_json())
+        assert shapely.equals_exact(geometry, original, tolerance=1e-6)
+    assert list(iter_geojson_features(table, target_crs="OGC:CRS84")) == (
+        geojson.features
+    )
+    geojson_path = geoparquet_to_geojson_file(
+        table,
+        tmp_path / "crs84.geojson",
+        target_crs="OGC:CRS84",
+    )
+    assert FeatureCollection(**json.loads(geojson_path.read_text())) == geojson
+
+    with pytest.raises(ValueError):
+        geojson_to_geoparquet(valid_geojson_obj, target_crs="NOT A CRS")
+    with pytest.raises(ValueError):
+        geoparquet_to_geojson(table, target_crs="NOT A CRS")
+
+
+def test_multiple_geometry_columns(tmp_path: Path):
+    """Test converting footprint, centroid and label point geometry columns."""
+    footprints = [shapely.box(i, i, i + 2, i + 1) for i in range(10)]
+    features = [
+        {
+            "type": "Feature",
+            "geometry": json.loads(shapely.to_geojson(footprint)),
+            "properties": {
+                "name": f"building_{i}",
+                "centroid": json.loads(shapely.to_geojson(footprint.centroid)),
+                "label_point": (
+                    None
+                    if i == 3
+                    else json.loads(shapely.to_geojson(footprint.point_on_surface()))
+                ),
+            },
+        }
+        for i, footprint in enumerate(footprints)
+    ]
+    feature_collection = FeatureCollection(type="FeatureCollection", features=features)
+    geo_metadata = {
+        "primary_column": "footprint",
+        "columns": {
+            "footprint": {"encoding": "WKB", "geometry_types": []},
+            "centroid": {"encoding": "WKB", "geometry_types": []},
+            "label_point": {"encoding": "WKB", "geometry_types": ["Point"]},
+        },
+    }
+    column_schema = pyarrow.schema(
+        [
+            ("name", pyarrow.string()),
+            ("centroid", pyarrow.binary()),
+            ("label_point", pyarrow.binary()),
+        ]
+    )
+    table = geojson_to_geoparquet(
+        feature_collection,
+        primary_column="footprint",
+        column_schema=column_schema,
+        geo_metadata=geo_metadata,
+    )
+    assert table.column_names == ["footprint", "name", "centroid", "label_point"]
+    centroids = shapely.from_wkb(table.column("centroid").to_numpy())
+    assert shapely.equals(centroids, shapely.centroid(footprints)).all()
+    assert table.column("label_point").null_count == 1
+
+    # every geometry column gets its own bbox and geometry types
+    columns = _decode_geo_metadata(table.schema.metadata)["columns"]
+    assert columns["footprint"]["bbox"] == [0, 0, 11, 10]
+    assert columns["footprint"]["geometry_types"] == ["Polygon"]
+    assert columns["centroid"]["bbox"] == [1, 0.5, 10, 9.5]
+    assert columns["centroid"]["geometry_types"] == ["Point"]
+    pyarrow.parquet.write_table(table, tmp_path / "buildings.parquet")
+    assert validate_geoparquet_file(tmp_path / "buildings.parquet", deep=True)
+
+    # the same parallel output
+    assert table.equals(
+        geojson_to_geoparquet(
+            feature_collection,
+            primary_column="footprint",
+            column_schema=column_schema,
+            geo_metadata=geo_metadata,
+            max_workers=2,
+        ),
+        check_metadata=True,
+    )
+
+    # secondary geometries are read back as GeoJSON geometry properties
+    geojson = geoparquet_to_geojson(table, primary_column="footprint")
+    assert geojson.bbox == (0, 0, 11, 10)
+    for feature, expected in zip(geojson.features, feature_collection.features):
+        assert feature.geometry == expected.geometry
+        assert feature.properties == expected.properties
+    assert (
+        geoparquet_to_geojson(
+            tmp_path / "buildings.parquet", primary_column="footprint"
+        )
+        == geojson
+    )
+    assert geoparquet_to_geojson(
+        table,
+        primary_column="footprint",
+        max_chunksize=3,
+        max_workers=2,
+    ) == geoparquet_to_geojson(table, primary_column="footprint", max_chunksize=3)
+    assert list(iter_geojson_features(table, primary_column="footprint")) == (
+        geojson.features
+    )
+    geojson_path = geoparquet_to_geojson_file(
+        table,
+        tmp_path / "buildings.geojson",
+        primary_column="footprint",
+    )
+    assert FeatureCollection(**json.loads(geojson_path.read_text())) == geojson
+
+    # and every geometry column is reprojected
+    geojson = geoparquet_to_geojson(
+        table,
+        primary_column="footprint",
+        target_crs="EPSG:3857",
+    )
+    transformer = pyproj.Transformer.from_crs("OGC:CRS84", "EPSG:3857", always_xy=True)
+    x, y = features[0]["properties"]["centroid"]["coordinates"]
+    assert np.allclose(
+        geojson.features[0].properties["centroid"]["coordinates"],
+        transformer.transform(x, y),
+    )
+
+    # the reusable converter matches
+    converter = GeoParquetConverter(
+        primary_column="footprint",
+        column_schema=column_schema,
+        geo_metadata=geo_metadata,
+    )
+    assert converter.to_table(feature_collection).equals(table, check_metadata=True)
+    assert converter.to_geojson(table) == geoparquet_to_geojson(
+        table,
+        primary_column="footprint",
+    )
+
+    # secondary geometry columns must be in the column schema
+    with pytest.raises(ValueError):
+        geojson_to_geoparquet(
+            feature_collection,
+            primary_column="footprint",
+            column_schema=pyarrow.schema([("name", pyarrow.string())]),
+            geo_metadata=geo_metadata,
+        )
+
+
+def test_lazy_geoparquet_file_read(
+    valid_geoparquet_table: pyarrow.Table,
+    tmp_path: Path,
+):
+    """Test that parquet files are read one memory mapped row group at a time."""
+    parquet_path = tmp_path / "row_groups.parquet"
+    pyarrow.parquet.write_table(valid_geoparquet_table, parquet_path, row_group_size=2)
+    parquet_file = _get_parquet_file(parquet_path)
+    assert parquet_file.num_row_groups == 4
+
+    schema, batches = _get_geoparquet_stream(parquet_path, "geometry")
+    assert schema.equals(valid_geoparquet_table.schema, check_metadata=True)
+    assert not isinstance(batches, list)
+    assert [len(batch) for batch in batches] == [2, 2, 2, 1]
+
+    assert geoparquet_to_geojson(parquet_path) == geoparquet_to_geojson(
+        valid_geoparquet_table
+    )
+    assert next(iter_geojson_features(parquet_path)) == next(
+        iter_geojson_features(valid_geoparquet_table)
+    )
+
+    with pytest.raises(TypeError):
+        _get_parquet_file(parquet_path, read_file_kwargs="NOT VALID")
+    with pytest.raises(TypeError):
+        _get_parquet_file(valid_geoparquet_table)
+
+
 def test_bad_geoparquet_to_geojson():
     # first we start with a table missing geo
     table = pyarrow.Table.from_pydict(
@@ -286,8 +845,60 @@ def test_bad_geoparquet_to_geojson():
         geoparquet_to_geojson(parquet_path)
     parquet_path.unlink()
 
+    # tables with other schema metadata (i.e., from pandas) have no bbox to find
+    table = pyarrow.Table.from_pandas(
+        pd.DataFrame({"geometry": [shapely.Point(1, 2).wkb], "name": ["a"]})
+    )
+    assert b"geo" not in table.schema.metadata
+    with pytest.warns(UserWarning, match="No GeoParquet metadata"):
+        geojson = geoparquet_to_geojson(table)
+    assert geojson.bbox is None
+    assert len(geojson.features) == 1
+
     # now we test bad inputs
     with pytest.raises(ValueError):
         geoparquet_to_geojson(-999)
     with pytest.raises(ValueError):
         geoparquet_to_geojson(table, primary_column="NOT_VALID_COLUMN")
+
+
+def test_geoparquet_converter(
+    valid_geojson_obj: FeatureCollection,
+):
+    """Test the reusable converter matches the conversion functions."""
+    metadata = _get_default_geo_metadata(valid_geojson_obj)
+    column_schema = pyarrow.schema([("name", pyarrow.string())])
+    converter = GeoParquetConverter(
+        column_schema=column_schema,
+        geo_metadata=metadata,
+    )
+    assert converter.column_schema.names == ["geometry", "name"]
+
+    for _ in range(2):
+        table = converter.to_table(valid_geojson_obj)
+        expected = geojson_to_geoparquet(
+            valid_geojson_obj,
+            column_schema=column_schema,
+            geo_metadata=metadata,
+        )
+        assert table.equals(expected)
+        assert table.schema.metadata == expected.schema.metadata
+        assert converter.to_geojson(table) == geoparquet_to_geojson(expected)
+
+    # a list of features and dict metadata work too
+    converter = GeoParquetConverter(
+        column_schema=column_schema,
+        geo_metadata=metadata.model_dump(),
+    )
+    table = converter.to_table(valid_geojson_obj.features[:2])
+    assert len(table) == 2
+
+    # default metadata allows any geometry type
+    converter = GeoParquetConverter()
+    table = converter.to_table(valid_geojson_obj)
+    assert len(converter.to_geojson(table).features) == len(valid_geojson_obj.features)
+
+    with pytest.raises(ValueError):
+        GeoParquetConverter(geo_metadata="NOT_VALID")
+    with pytest.raises(ValueError):
+        GeoParquetConverter(column_schema={"NOT": "VALID"})
@@ -0,0 +1,135 @@
+import pytest
+import pyarrow
+import pyarrow.dataset
+import pyarrow.parquet
+import geopandas as gpd
+from pathlib import Path
+from geojson_pydantic.features import FeatureCollection
+
+from geoparquet_pydantic.schemas import GeoParquetMetadata
+from geoparquet_pydantic.convert import (
+    _decode_geo_metadata,
+    _get_default_geo_metadata,
+    geojson_to_geoparquet,
+    geoparquet_to_geojson,
+)
+from geoparquet_pydantic.dataset import (
+    _merge_bbox,
+    append_to_geoparquet_dataset,
+)
+from geoparquet_pydantic.validate import validate_geoparquet_file
+
+
+def test_merge_bbox():
+    assert _merge_bbox(None, None) is None
+    assert _merge_bbox([0, 0, 1, 1], None) == [0, 0, 1, 1]
+    assert _merge_bbox(None, [0, 0, 1, 1]) == [0, 0, 1, 1]
+    assert _merge_bbox([0, 0, 1, 1], [-1, 0.5, 0.5, 2]) == [-1, 0, 1, 2]
+
+
+def test_append_to_geoparquet_dataset(
+    valid_geojson_obj: FeatureCollection,
+    tmp_path: Path,
+):
+    """Test appending features to a GeoParquet dataset in several deltas."""
+    dataset_dir = tmp_path / "dataset"
+    features = valid_geojson_obj.features
+    written_files = []
+    for i in range(0, len(features), 3):
+        delta = FeatureCollection(
+            type="FeatureCollection", features=features[i : i + 3]
+        )
+        written_files.append(append_to_geoparquet_dataset(delta, dataset_dir))
+
+        # each file only has the metadata of its own features
+        file_geo = _decode_geo_metadata(
+            pyarrow.parquet.read_schema(written_files[-1]).metadata
+        )
+        assert set(file_geo["columns"]["geometry"]["geometry_types"]) == {
+            f.geometry.type for f in delta.features
+        }
+
+    assert len(set(written_files)) == 3
+    assert all(f.exists() for f in written_files)
+
+    # the sidecar indexes every file and merges the geo metadata
+    metadata_path = dataset_dir / "_metadata"
+    assert validate_geoparquet_file(metadata_path)
+    dataset_metadata = pyarrow.parquet.read_metadata(metadata_path)
+    assert dataset_metadata.num_rows == len(features)
+    assert dataset_metadata.num_row_groups == 3
+    dataset_geo = _decode_geo_metadata(dataset_metadata.metadata)
+    assert len(dataset_geo["columns"]["geometry"]["geometry_types"]) == 7
+    assert dataset_geo["columns"]["geometry"]["bbox"] == [0, 0, 26, 26]
+
+    table = pyarrow.dataset.parquet_dataset(metadata_path).to_table()
+    assert len(table) == len(features)
+    assert len(geoparquet_to_geojson(dataset_dir).features) == len(features)
+    assert len(gpd.read_parquet(written_files[0])) == 3
+
+    # the appended schema must match the dataset
+    with pytest.raises(ValueError):
+        append_to_geoparquet_dataset(
+            valid_geojson_obj,
+            dataset_dir,
+            column_schema=pyarrow.schema([("name", pyarrow.string())]),
+        )
+    with pytest.raises(TypeError):
+        append_to_geoparquet_dataset(
+            valid_geojson_obj,
+            dataset_dir,
+            write_table_kwargs="NOT_VALID",
+        )
+
+    # and so must the non-mergeable geo metadata
+    geo_metadata = _get_default_geo_metadata(valid_geojson_obj)
+    for update in [{"crs": "EPSG:3857"}, {"edges": "spherical"}]:
+        column_metadata = geo_metadata.columns["geometry"].model_dump()
+        with pytest.raises(ValueError):
+            append_to_geoparquet_dataset(
+                valid_geojson_obj,
+                dataset_dir,
+                geo_metadata=GeoParquetMetadata(
+                    columns={"geometry": {**column_metadata, **update}},
+                ),
+            )
+    with pytest.raises(ValueError):
+        append_to_geoparquet_dataset(
+            valid_geojson_obj,
+            dataset_dir,
+            primary_column="geom",
+        )
+    assert pyarrow.parquet.read_metadata(metadata_path).num_row_groups == 3
+    assert len(list(dataset_dir.glob("*.parquet"))) == 3
+
+
+def test_append_to_existing_files(
+    valid_geojson_obj: FeatureCollection,
+    tmp_path: Path,
+):
+    """Test that the first append indexes existing data files without a sidecar."""
+    dataset_dir = tmp_path / "dataset"
+    dataset_dir.mkdir()
+    existing = FeatureCollection(
+        type="FeatureCollection", features=valid_geojson_obj.features[:6]
+    )
+    pyarrow.parquet.write_table(
+        geojson_to_geoparquet(existing),
+        dataset_dir / "existing.parquet",
+    )
+    delta = FeatureCollection(
+        type="FeatureCollection", features=valid_geojson_obj.features[6:]
+    )
+    append_to_geoparquet_dataset(delta, dataset_dir)
+
+    dataset_metadata = pyarrow.parquet.read_metadata(dataset_dir / "_metadata")
+    assert dataset_metadata.num_rows == len(valid_geojson_obj.features)
+    assert dataset_metadata.num_row_groups == 2
+    assert dataset_metadata.row_group(0).column(0).file_path == "existing.parquet"
+    dataset_geo = _decode_geo_metadata(dataset_metadata.metadata)
+    assert set(dataset_geo["columns"]["geometry"]["geometry_types"]) == {
+        f.geometry.type for f in valid_geojson_obj.features
+    }
+    assert len(geoparquet_to_geojson(dataset_dir).features) == len(
+        valid_geojson_obj.features
+    )
@@ -0,0 +1,108 @@
+import os
+import pytest
+import numpy as np
+import pyarrow
+import pyarrow.parquet
+import shapely
+from pathlib import Path
+
+from geoparquet_pydantic.convert import (
+    GeoParquetConverter,
+    geoparquet_to_geojson,
+)
+from geoparquet_pydantic.index import (
+    _hilbert,
+    build_spatial_index,
+    load_spatial_index,
+)
+
+
+@pytest.fixture
+def points_geoparquet_file(tmp_path: Path) -> Path:
+    rng = np.random.default_rng(0)
+    geometries = shapely.points(rng.uniform(0, 100, (5_000, 2)))
+    geometries[::7] = None
+    table = pyarrow.table(
+        {
+            "geometry": shapely.to_wkb(geometries),
+            "id": np.arange(len(geometries)),
+        }
+    ).replace_schema_metadata(GeoParquetConverter().column_schema.metadata)
+    path = tmp_path / "points.parquet"
+    pyarrow.parquet.write_table(table, path, row_group_size=600)
+    return path
+
+
+def _brute_force_query(path: Path, bbox: list[float]) -> np.ndarray:
+    table = pyarrow.parquet.read_table(path)
+    bounds = shapely.bounds(shapely.from_wkb(table.column("geometry").to_numpy()))
+    return np.flatnonzero(
+        (bounds[:, 0] <= bbox[2])
+        & (bounds[:, 1] <= bbox[3])
+        & (bounds[:, 2] >= bbox[0])
+        & (bounds[:, 3] >= bbox[1])
+    )
+
+
+def test_hilbert():
+    """Test the hilbert curve visits each cell of a 4x4 grid once, moving one step."""
+    x, y = np.meshgrid(np.arange(4), np.arange(4))
+    x, y = x.ravel() * 2**14, y.ravel() * 2**14
+    order = np.argsort(_hilbert(x, y))
+    assert len(set(_hilbert(x, y).tolist())) == 16
+    steps = np.abs(np.diff(x[order])) + np.abs(np.diff(y[order]))
+    assert np.all(steps == 2**14)
+
+
+def test_spatial_index(points_geoparquet_file: Path):
+    """Test building, querying, and reading with a spatial index."""
+    index_path = build_spatial_index(points_geoparquet_file, node_size=4)
+    assert index_path == Path(str(points_geoparquet_file) + ".rtree")
+    index = load_spatial_index(points_geoparquet_file, rebuild=False)
+    assert isinstance(index.boxes, np.memmap)
+    assert index.num_items == 5_000 - len(range(0, 5_000, 7))
+
+    for bbox in [
+        [10, 10, 20, 30],
+        [0, 0, 100, 100],
+        [50, 50, 50, 50],
+        [200, 200, 300, 300],
+    ]:
+        rows = index.query(bbox)
+        assert np.array_equal(rows, _brute_force_query(points_geoparquet_file, bbox))
+
+        table = index.read(bbox)
+        assert np.array_equal(table.column("id").to_numpy(), rows)
+        assert table.schema.metadata[b"geo"]
+
+    table = index.read([10, 10, 20, 30], columns=["geometry"])
+    assert table.column_names == ["geometry"]
+    geojson = geoparquet_to_geojson(table)
+    for feature in geojson.features:
+        x, y = feature.geometry.coordinates
+        assert 10 <= x <= 20 and 10 <= y <= 30
+
+
+def test_stale_spatial_index(points_geoparquet_file: Path):
+    """Test that indexes are invalidated when the GeoParquet file changes."""
+    with pytest.raises(ValueError):
+        load_spatial_index(points_geoparquet_file, rebuild=False)
+    index = load_spatial_index(points_geoparquet_file)
+    assert not index.is_stale()
+
+    # rewrite the file with fewer rows
+    table = pyarrow.parquet.read_table(points_geoparquet_file).slice(0, 100)
+    pyarrow.parquet.write_table(table, points_geoparquet_file)
+    stat = os.stat(points_geoparquet_file)
+    os.utime(points_geoparquet_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert index.is_stale()
+    with pytest.raises(ValueError):
+        index.read([0, 0, 100, 100])
+    with pytest.raises(ValueError):
+        load_spatial_index(points_geoparquet_file, rebuild=False)
+
+    index = load_spatial_index(points_geoparquet_file)
+    assert not index.is_stale()
+    assert len(index.read([0, 0, 100, 100])) == len(range(0, 100)) - len(
+        range(0, 100, 7)
+    )
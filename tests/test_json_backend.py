@@ -0,0 +1,80 @@
+import pytest
+import datetime
+import importlib.util
+import json
+import pyarrow
+from pathlib import Path
+from geojson_pydantic.features import FeatureCollection
+
+from geoparquet_pydantic import json_backend
+from geoparquet_pydantic.convert import (
+    _decode_geo_metadata,
+    geojson_to_geoparquet,
+    geoparquet_to_geojson,
+    geoparquet_to_geojson_file,
+)
+
+INSTALLED_BACKENDS = [
+    name
+    for name in json_backend.JSON_BACKENDS
+    if name == "json" or importlib.util.find_spec(name)
+]
+
+
+@pytest.fixture(params=INSTALLED_BACKENDS)
+def backend(request):
+    default_backend = json_backend.get_json_backend()
+    yield json_backend.set_json_backend(request.param)
+    json_backend.set_json_backend(default_backend)
+
+
+def test_default_json_backend():
+    assert json_backend.get_json_backend() == INSTALLED_BACKENDS[0]
+    assert json_backend.set_json_backend() == INSTALLED_BACKENDS[0]
+
+
+def test_bad_json_backend():
+    default_backend = json_backend.get_json_backend()
+    with pytest.raises(ValueError):
+        json_backend.set_json_backend("NOT VALID")
+    assert json_backend.get_json_backend() == default_backend
+
+
+def test_json_backend_round_trip(backend: str):
+    obj = {"a": [1, 2.5, None, True], "b": {"c": "ü"}}
+    assert json_backend.get_json_backend() == backend
+    assert json.loads(json_backend.dumps(obj)) == obj
+    assert json_backend.loads(json.dumps(obj)) == obj
+    assert json_backend.loads(json.dumps(obj).encode("utf-8")) == obj
+
+    # unsupported types are serialized as strings
+    assert isinstance(json.loads(json_backend.dumps(datetime.date(2024, 1, 1))), str)
+
+    with pytest.raises(ValueError):
+        json_backend.loads("{NOT VALID")
+
+
+def test_json_backend_conversions(
+    backend: str,
+    valid_geojson_file: Path,
+    valid_geojson_obj: FeatureCollection,
+    tmp_path: Path,
+):
+    """Test that every backend converts GeoJSON <> GeoParquet identically."""
+    table = geojson_to_geoparquet(valid_geojson_file)
+    assert [json.loads(p) for p in table.column("properties").to_pylist()] == [
+        f.properties for f in valid_geojson_obj.features
+    ]
+    assert _decode_geo_metadata(table.schema.metadata)["primary_column"] == "geometry"
+
+    table = geojson_to_geoparquet(
+        valid_geojson_obj,
+        column_schema=pyarrow.schema([("name", pyarrow.string())]),
+    )
+    geojson = geoparquet_to_geojson(table)
+    assert [f.geometry for f in geojson.features] == [
+        f.geometry for f in valid_geojson_obj.features
+    ]
+
+    geojson_path = geoparquet_to_geojson_file(table, tmp_path / "valid.geojson")
+    assert FeatureCollection(**json.loads(geojson_path.read_text())) == geojson
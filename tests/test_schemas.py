@@ -76,6 +76,35 @@ def test_bad_geo_column_metadata(good_geo_column_metadata):
     with pytest.raises(ValueError):
         GeometryColumnMetadata(**bad_orientation)
 
+    # Test bad covering
+    bad_covering = good_geo_column_metadata.copy()
+    bad_covering["covering"] = {"bbox": {"xmin": ["bbox", "xmin"]}}
+    with pytest.raises(ValueError):
+        GeometryColumnMetadata(**bad_covering)
+
+
+def test_geo_column_metadata_covering(good_geo_column_metadata):
+    """Test that a covering (and orientation) is only serialized when set."""
+    metadata = GeometryColumnMetadata(**good_geo_column_metadata)
+    assert "covering" not in metadata.model_dump()
+    assert metadata.model_dump()["orientation"] == "counterclockwise"
+    metadata = GeometryColumnMetadata(
+        **{**good_geo_column_metadata, "orientation": None}
+    )
+    assert "orientation" not in metadata.model_dump()
+
+    covering = {
+        "bbox": {name: ["bbox", name] for name in ["xmin", "ymin", "xmax", "ymax"]},
+    }
+    metadata = GeometryColumnMetadata(**good_geo_column_metadata, covering=covering)
+    assert metadata.model_dump()["covering"] == covering
+    assert (
+        GeoParquetMetadata(columns={"geometry": metadata}).model_dump()["columns"][
+            "geometry"
+        ]["covering"]
+        == covering
+    )
+
 
 def test_good_geoparquet(good_geo_column_metadata):
 
@@ -103,6 +132,16 @@ def test_good_geoparquet(good_geo_column_metadata):
     assert "geom" in geo_parquet.columns
     assert isinstance(geo_parquet.columns["geom"], GeometryColumnMetadata)
 
+    # secondary geometry columns are converted too
+    geo_parquet = GeoParquetMetadata(
+        columns={
+            "geometry": good_geo_column_metadata,
+            "centroid": str(good_geo_column_metadata),
+        },
+    )
+    assert isinstance(geo_parquet.columns["geometry"], GeometryColumnMetadata)
+    assert isinstance(geo_parquet.columns["centroid"], GeometryColumnMetadata)
+
 
 def test_bad_geoparquet(good_geo_column_metadata):
 
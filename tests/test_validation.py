@@ -1,6 +1,10 @@
+import json
 import pyarrow
 import pytest
+import shapely
 from pathlib import Path
+from geojson_pydantic.features import FeatureCollection
+from geoparquet_pydantic.convert import geojson_to_geoparquet
 from geoparquet_pydantic.validate import (
     validate_geoparquet_table,
     validate_geoparquet_file,
@@ -60,3 +64,116 @@ def test_invalid_geoparquet_file(no_geo_metadata_table, bad_geo_metadata_table):
     pyarrow.parquet.write_table(no_geo_metadata_table, "test2.parquet")
     assert validate_geoparquet_file("test2.parquet") == False
     Path("test2.parquet").unlink()
+
+
+def _make_geo_table(wkts: list[str], column_metadata: dict) -> pyarrow.Table:
+    return pyarrow.Table.from_pydict(
+        {"geometry": shapely.to_wkb(shapely.from_wkt(wkts)).tolist()},
+        metadata={
+            b"geo": json.dumps(
+                {
+                    "version": "1.1.0-dev",
+                    "primary_column": "geometry",
+                    "columns": {"geometry": {"encoding": "WKB", **column_metadata}},
+                }
+            ).encode("utf-8")
+        },
+    )
+
+
+def test_deep_validate_geoparquet_table(valid_geojson_obj):
+    """Test the validation of GeoParquet table geometry data."""
+    table = geojson_to_geoparquet(valid_geojson_obj)
+    assert validate_geoparquet_table(table, deep=True)
+    assert validate_geoparquet_table(table, deep=True, max_workers=2)
+    assert not validate_geoparquet_table(table, primary_column="NOT_VALID_COLUMN")
+
+    # default metadata of 3D geometries is valid too
+    table_3d = geojson_to_geoparquet(
+        FeatureCollection(
+            type="FeatureCollection",
+            features=[
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [1, 2, 3]},
+                    "properties": {},
+                }
+            ],
+        )
+    )
+    assert validate_geoparquet_table(table_3d, deep=True)
+
+    # invalid WKB
+    bad_wkb_table = pyarrow.Table.from_pydict(
+        {"geometry": [b"NOT_VALID_GEOMETRY"]},
+        metadata=table.schema.metadata,
+    )
+    assert validate_geoparquet_table(bad_wkb_table)
+    assert not validate_geoparquet_table(bad_wkb_table, deep=True)
+
+    # geometry types not declared in the metadata
+    points = ["POINT (1 1)", "POINT (2 2)"]
+    assert validate_geoparquet_table(
+        _make_geo_table(points, {"geometry_types": ["Point"]}),
+        deep=True,
+    )
+    assert not validate_geoparquet_table(
+        _make_geo_table(points, {"geometry_types": ["Polygon"]}),
+        deep=True,
+    )
+
+    # geometries outside the bbox
+    assert not validate_geoparquet_table(
+        _make_geo_table(points, {"geometry_types": [], "bbox": [0, 0, 1.5, 1.5]}),
+        deep=True,
+    )
+
+    # clockwise polygons
+    clockwise = ["POLYGON ((0 0, 0 1, 1 1, 1 0, 0 0))"]
+    assert validate_geoparquet_table(
+        _make_geo_table(clockwise, {"geometry_types": ["Polygon"]}),
+        deep=True,
+    )
+    assert not validate_geoparquet_table(
+        _make_geo_table(
+            clockwise,
+            {"geometry_types": ["Polygon"], "orientation": "counterclockwise"},
+        ),
+        deep=True,
+    )
+
+
+def test_deep_validate_geoparquet_file(valid_geoparquet_file: Path):
+    """Test the validation of GeoParquet file geometry data, row group by row group."""
+    assert validate_geoparquet_file(valid_geoparquet_file, deep=True)
+
+    table = _make_geo_table(
+        ["POINT (1 1)", "POINT (2 2)", "POINT (3 3)", "LINESTRING (0 0, 1 1)"],
+        {"geometry_types": ["Point"]},
+    )
+    pyarrow.parquet.write_table(table, "test3.parquet", row_group_size=1)
+    assert validate_geoparquet_file("test3.parquet")
+    for max_workers in [0, 2, -1]:
+        for fail_fast in [False, True]:
+            assert not validate_geoparquet_file(
+                "test3.parquet",
+                deep=True,
+                max_workers=max_workers,
+                fail_fast=fail_fast,
+            )
+    Path("test3.parquet").unlink()
+
+
+def test_validate_geoparquet_stream(valid_geoparquet_table):
+    """Test the validation of RecordBatchReaders and Arrow PyCapsule streams."""
+    reader = pyarrow.RecordBatchReader.from_batches(
+        valid_geoparquet_table.schema,
+        valid_geoparquet_table.to_batches(max_chunksize=2),
+    )
+    assert validate_geoparquet_table(reader, deep=True)
+
+    class MockArrowStream:
+        def __arrow_c_stream__(self, requested_schema=None):
+            return valid_geoparquet_table.__arrow_c_stream__(requested_schema)
+
+    assert validate_geoparquet_table(MockArrowStream(), deep=True)
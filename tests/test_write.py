@@ -0,0 +1,179 @@
+import pytest
+import geopandas as gpd
+import pyarrow
+import pyarrow.parquet
+import shapely
+from pathlib import Path
+from geojson_pydantic.features import FeatureCollection
+
+from geoparquet_pydantic.convert import (
+    _decode_geo_metadata,
+    geojson_to_geoparquet,
+    geoparquet_to_geojson,
+)
+from geoparquet_pydantic.validate import validate_geoparquet_file
+from geoparquet_pydantic.write import (
+    WRITE_PRESETS,
+    _get_dictionary_columns,
+    _get_row_group_size,
+    write_geoparquet,
+)
+
+
+@pytest.fixture
+def valid_table(valid_geojson_obj: FeatureCollection) -> pyarrow.Table:
+    return geojson_to_geoparquet(
+        valid_geojson_obj,
+        column_schema=pyarrow.schema([("name", pyarrow.string())]),
+    )
+
+
+def test_get_row_group_size():
+    column = pyarrow.chunked_array([[b"0" * 100] * 10])
+    assert _get_row_group_size(column, 1000) == 10
+    assert _get_row_group_size(column, 10) == 1
+    assert _get_row_group_size(column, 1024**4) == 1024**2
+    assert _get_row_group_size(pyarrow.chunked_array([], pyarrow.binary()), 10) > 0
+
+
+def test_get_dictionary_columns():
+    table = pyarrow.table(
+        {
+            "geometry": [b"0"] * 4,
+            "low": ["a", "a", "b", "a"],
+            "high": ["a", "b", "c", "d"],
+            "nested": [[1], [1], [1], [1]],
+        }
+    )
+    assert _get_dictionary_columns(table, ["geometry"]) == ["low"]
+
+
+@pytest.mark.parametrize("preset", list(WRITE_PRESETS.keys()))
+def test_write_geoparquet(
+    preset: str,
+    valid_table: pyarrow.Table,
+    tmp_path: Path,
+):
+    """Test that every preset writes a valid GeoParquet file with the same features."""
+    path = write_geoparquet(
+        valid_table,
+        tmp_path / f"{preset}.parquet",
+        preset=preset,
+        row_group_bytes=100,
+    )
+    assert validate_geoparquet_file(path, deep=True)
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    assert parquet_file.num_row_groups > 1
+
+    features = geoparquet_to_geojson(path).features
+    expected_features = geoparquet_to_geojson(valid_table).features
+    key = lambda f: f.properties["name"]
+    for feature, expected in zip(
+        sorted(features, key=key),
+        sorted(expected_features, key=key),
+    ):
+        assert feature.geometry == expected.geometry
+        assert feature.properties == expected.properties
+    assert len(gpd.read_parquet(path)) == valid_table.num_rows
+
+    # statistics are never written for the geometry column
+    row_group = parquet_file.metadata.row_group(0)
+    assert row_group.column(0).path_in_schema == "geometry"
+    assert not row_group.column(0).is_stats_set
+
+
+def test_write_fast_spatial_read(
+    valid_table: pyarrow.Table,
+    tmp_path: Path,
+):
+    """Test the bbox covering column, its metadata and statistics."""
+    path = write_geoparquet(
+        valid_table,
+        tmp_path / "spatial.parquet",
+        preset="fast-spatial-read",
+        row_group_bytes=100,
+    )
+    table = pyarrow.parquet.read_table(path)
+    assert table.column_names == ["geometry", "name", "bbox"]
+    column_metadata = _decode_geo_metadata(table.schema.metadata)["columns"]["geometry"]
+    assert column_metadata["covering"]["bbox"]["xmin"] == ["bbox", "xmin"]
+    assert column_metadata["bbox"] == [0, 0, 26, 26]
+
+    bounds = shapely.bounds(shapely.from_wkb(table.column("geometry").to_numpy()))
+    bbox = table.column("bbox").combine_chunks()
+    for i, name in enumerate(["xmin", "ymin", "xmax", "ymax"]):
+        assert bbox.field(name).to_pylist() == bounds[:, i].tolist()
+
+    metadata = pyarrow.parquet.ParquetFile(path).metadata
+    xmin_statistics = [
+        metadata.row_group(i).column(2).statistics
+        for i in range(metadata.num_row_groups)
+    ]
+    assert all(s is not None and s.has_min_max for s in xmin_statistics)
+
+    # readers can filter with the covering bbox
+    gdf = gpd.read_parquet(path, bbox=(0, 0, 3, 3))
+    assert 0 < len(gdf) < valid_table.num_rows
+
+    # a declared covering bbox column is recomputed when written again
+    path = write_geoparquet(
+        table.slice(0, 3),
+        tmp_path / "again.parquet",
+        preset="fast-spatial-read",
+    )
+    table_again = pyarrow.parquet.read_table(path)
+    assert table_again.column_names == ["geometry", "name", "bbox"]
+    bounds = shapely.bounds(shapely.from_wkb(table_again.column("geometry").to_numpy()))
+    bbox = table_again.column("bbox").combine_chunks()
+    assert bbox.field("xmax").to_pylist() == bounds[:, 2].tolist()
+
+    # binary_view geometry columns (i.e., from Polars to_arrow()) are written as WKB
+    index = valid_table.schema.get_field_index("geometry")
+    view_table = valid_table.set_column(
+        index,
+        valid_table.schema.field(index).with_type(pyarrow.binary_view()),
+        valid_table.column(index).cast(pyarrow.binary_view()),
+    )
+    path = write_geoparquet(
+        view_table,
+        tmp_path / "view.parquet",
+        preset="fast-spatial-read",
+    )
+    table_view = pyarrow.parquet.read_table(path)
+    assert table_view.schema.field("geometry").type == pyarrow.large_binary()
+    assert table_view.column("bbox").equals(
+        pyarrow.parquet.read_table(
+            write_geoparquet(
+                valid_table,
+                tmp_path / "binary.parquet",
+                preset="fast-spatial-read",
+            )
+        ).column("bbox")
+    )
+
+    # otherwise the bbox column name is reserved
+    with pytest.raises(ValueError):
+        write_geoparquet(
+            table.replace_schema_metadata(valid_table.schema.metadata),
+            tmp_path / "reserved.parquet",
+            preset="fast-spatial-read",
+        )
+
+
+def test_bad_write_geoparquet(
+    valid_table: pyarrow.Table,
+    tmp_path: Path,
+):
+    with pytest.raises(ValueError):
+        write_geoparquet(valid_table, tmp_path / "bad.parquet", preset="NOT VALID")
+    with pytest.raises(TypeError):
+        write_geoparquet(
+            valid_table,
+            tmp_path / "bad.parquet",
+            write_table_kwargs="NOT VALID",
+        )
+    with pytest.raises(ValueError):
+        write_geoparquet(
+            valid_table.replace_schema_metadata(None),
+            tmp_path / "bad.parquet",
+        )